@@ -11,6 +11,14 @@ class Repository(ABC, Generic[T, TId]):
     @abstractmethod
     async def add(self, entity: T) -> None: ...
 
+    async def add_many(self, entities: Sequence[T]) -> None:
+        for entity in entities:
+            await self.add(entity)
+
+    async def update_many(self, entities: Sequence[T]) -> None:
+        for entity in entities:
+            await self.update(entity)
+
     @abstractmethod
     async def get(self, entity_id: TId) -> Optional[T]: ...
 
@@ -53,6 +61,28 @@ class Repository(ABC, Generic[T, TId]):
         sort_desc: bool = False,
     ) -> Sequence[T]: ...
 
+    async def list_by_ids(self, ids: Sequence[TId]) -> Sequence[T]:
+        if not ids:
+            return []
+        return await self.list_by_fields({"id": list(ids)}, limit=None)
+
+    async def get_many(self, ids: Sequence[TId]) -> dict[TId, T]:
+        entities = await self.list_by_ids(list(dict.fromkeys(ids)))
+        out: dict[TId, T] = {}
+        for entity in entities:
+            eid = entity.get("id") if isinstance(entity, dict) else getattr(entity, "id", None)
+            if eid is not None:
+                out[eid] = entity
+        return out
+
+    async def get_many_by_index(self, index: str, values: Sequence[Hashable]) -> dict[Hashable, T]:
+        out: dict[Hashable, T] = {}
+        for value in dict.fromkeys(values):
+            entity = await self.get_by_index(index, value)
+            if entity is not None:
+                out[value] = entity
+        return out
+
     @abstractmethod
     async def distinct_values(
         self,
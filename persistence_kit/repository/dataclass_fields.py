@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import sys
+from dataclasses import Field, fields
+from functools import lru_cache
+from typing import Any, get_type_hints
+
+
+@lru_cache(maxsize=None)
+def field_info(cls: type) -> tuple[tuple[str, ...], tuple[Field, ...]]:
+    fs = fields(cls)
+    return tuple(sys.intern(f.name) for f in fs), fs
+
+
+@lru_cache(maxsize=None)
+def resolved_field_types(cls: type) -> dict[str, Any]:
+    try:
+        hints = get_type_hints(cls)
+    except Exception:
+        hints = {}
+    return {f.name: hints.get(f.name, f.type) for f in field_info(cls)[1]}
+
+
+@lru_cache(maxsize=None)
+def field_name_set(cls: type) -> frozenset[str]:
+    return frozenset(field_info(cls)[0])
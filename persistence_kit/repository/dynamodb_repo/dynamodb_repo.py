@@ -23,6 +23,8 @@ from persistence_kit.repository.filter_ops import (
 T = TypeVar("T")
 TId = TypeVar("TId", bound=Hashable)
 
+_BATCH_GET_CHUNK = 100
+
 
 def _range_to_condition(attr: Attr, value: Mapping[str, Any]) -> ConditionBase | None:
     conditions: list[ConditionBase] = []
@@ -140,6 +142,24 @@ class DynamoRepository(Repository[T, TId], Generic[T, TId]):
         item = response.get("Item")
         return self._mapper.from_item(item) if item else None
 
+    @override
+    async def list_by_ids(self, ids: Sequence[TId]) -> Sequence[T]:
+        if not ids:
+            return []
+        table_name = self._table.name
+        keys = [{"id": _serialize_value(i)} for i in dict.fromkeys(ids)]
+        entities: list[T] = []
+        for start in range(0, len(keys), _BATCH_GET_CHUNK):
+            request: dict[str, Any] = {table_name: {"Keys": keys[start : start + _BATCH_GET_CHUNK]}}
+            while request:
+                response = self._dynamodb.batch_get_item(RequestItems=request)
+                entities.extend(
+                    self._mapper.from_item(item)
+                    for item in response.get("Responses", {}).get(table_name, [])
+                )
+                request = response.get("UnprocessedKeys") or None
+        return entities
+
     @override
     async def list(
         self,
@@ -29,16 +29,13 @@ def iter_criteria_groups(value: Any) -> Iterable[Mapping[str, Any]]:
     return value
 
 
-def iter_range_ops(value: Mapping[str, Any]) -> Iterable[tuple[str, Any]]:
-    if not value:
-        return []
-    items = list(value.items())
-    for op, v in items:
+def validate_range_ops(value: Mapping[str, Any]) -> None:
+    for op, v in value.items():
         if op == "between":
-            if not isinstance(v, list) or len(v) != 2:
+            if not isinstance(v, (list, tuple)) or len(v) != 2:
                 raise ValueError("between expects a list with exactly two values")
         elif op == "in":
-            if not isinstance(v, list):
+            if not isinstance(v, (list, tuple)):
                 raise ValueError("in expects a list")
         elif op in _SIMPLE_OPS:
             continue
@@ -46,7 +43,17 @@ def iter_range_ops(value: Mapping[str, Any]) -> Iterable[tuple[str, Any]]:
             continue
         else:
             raise ValueError(f"Unsupported operator: {op}")
-    return items
+
+
+def range_ops_items(value: Mapping[str, Any]) -> list[tuple[str, Any]]:
+    return list(value.items())
+
+
+def iter_range_ops(value: Mapping[str, Any]) -> Iterable[tuple[str, Any]]:
+    if not value:
+        return []
+    validate_range_ops(value)
+    return range_ops_items(value)
 
 
 def _matches_string_op(current: Any, op: str, expected: Any) -> bool:
@@ -69,64 +76,75 @@ def _matches_string_op(current: Any, op: str, expected: Any) -> bool:
     raise ValueError(f"Unsupported operator: {op}")
 
 
-def match_value(current: Any, expected: Any) -> bool:
+def _compile_range_matcher(ops: list[tuple[str, Any]]) -> Callable[[Any], bool]:
+    checks: list[Callable[[Any], bool]] = []
+    for op, value in ops:
+        if op == "between":
+            lo, hi = value
+            checks.append(lambda cur, lo=lo, hi=hi: cur is not None and lo <= cur <= hi)
+        elif op == "gte":
+            checks.append(lambda cur, v=value: cur is not None and cur >= v)
+        elif op == "gt":
+            checks.append(lambda cur, v=value: cur is not None and cur > v)
+        elif op == "lte":
+            checks.append(lambda cur, v=value: cur is not None and cur <= v)
+        elif op == "lt":
+            checks.append(lambda cur, v=value: cur is not None and cur < v)
+        elif op == "in":
+            checks.append(lambda cur, v=value: cur in v)
+        elif op == "eq":
+            checks.append(lambda cur, v=value: cur == v)
+        elif op == "ne":
+            checks.append(lambda cur, v=value: cur != v)
+        else:
+            checks.append(lambda cur, op=op, v=value: _matches_string_op(cur, op, v))
+    if len(checks) == 1:
+        return checks[0]
+    return lambda cur: all(check(cur) for check in checks)
+
+
+def compile_value_matcher(expected: Any) -> Callable[[Any], bool]:
     if expected is None:
-        return current is None
+        return lambda cur: cur is None
     if is_multi_value(expected):
-        return current in expected
+        return lambda cur: cur in expected
     if is_range_dict(expected):
         ops = list(iter_range_ops(expected))
         if not ops:
-            return False
-        for op, value in ops:
-            if op == "between":
-                lo, hi = value
-                if current is None or current < lo or current > hi:
-                    return False
-            elif op == "gte":
-                if current is None or current < value:
-                    return False
-            elif op == "gt":
-                if current is None or current <= value:
-                    return False
-            elif op == "lte":
-                if current is None or current > value:
-                    return False
-            elif op == "lt":
-                if current is None or current >= value:
-                    return False
-            elif op == "in":
-                if current not in value:
-                    return False
-            elif op == "eq":
-                if current != value:
-                    return False
-            elif op == "ne":
-                if current == value:
-                    return False
-            else:
-                if not _matches_string_op(current, op, value):
-                    return False
-        return True
-    return current == expected
+            return lambda cur: False
+        return _compile_range_matcher(ops)
+    return lambda cur: cur == expected
 
 
-def match_criteria(
+def compile_criteria(
     criteria: Mapping[str, Any],
-    resolve_value: Callable[[str], Any],
-) -> bool:
+) -> Callable[[Callable[[str], Any]], bool]:
     if not criteria:
-        return False
+        return lambda resolve_value: False
+    tests: list[Callable[[Callable[[str], Any]], bool]] = []
     for field, expected in criteria.items():
         if is_logical_key(field):
-            groups = list(iter_criteria_groups(expected))
-            if field == "or":
-                if not any(match_criteria(group, resolve_value) for group in groups):
-                    return False
-            else:
-                if not all(match_criteria(group, resolve_value) for group in groups):
-                    return False
+            groups = [compile_criteria(group) for group in iter_criteria_groups(expected)]
+            combine = any if field == "or" else all
+            tests.append(
+                lambda resolve_value, groups=groups, combine=combine: combine(
+                    group(resolve_value) for group in groups
+                )
+            )
             continue
-        if not match_value(resolve_value(field), expected):
-            return False
-    return True
+        matcher = compile_value_matcher(expected)
+        tests.append(lambda resolve_value, f=field, m=matcher: m(resolve_value(f)))
+    if len(tests) == 1:
+        return tests[0]
+    return lambda resolve_value: all(test(resolve_value) for test in tests)
+
+
+def match_value(current: Any, expected: Any) -> bool:
+    return compile_value_matcher(expected)(current)
+
+
+def match_criteria(
+    criteria: Mapping[str, Any],
+    resolve_value: Callable[[str], Any],
+) -> bool:
+    return compile_criteria(criteria)(resolve_value)
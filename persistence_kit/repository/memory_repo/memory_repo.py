@@ -6,11 +6,13 @@ try:
 except ImportError:
     from typing_extensions import override
 
+import heapq
+
 from persistence_kit.contracts.repository import Repository
 from persistence_kit.repository.filter_ops import (
+    compile_criteria,
     is_multi_value,
     is_range_dict,
-    match_criteria,
 )
 
 T = TypeVar("T")
@@ -21,16 +23,61 @@ def _get_field_value(entity: Any, field: str) -> Any:
         return entity.get(field)
     return getattr(entity, field, None)
 
+def _field_getter(probe: Any) -> Callable[[Any, str], Any]:
+    if isinstance(probe, dict):
+        return dict.get
+    return lambda entity, field: getattr(entity, field, None)
+
 class MemoryRepository(Repository[T, TId], Generic[T, TId]):
     def __init__(
         self,
         id_getter: Callable[[T], TId],
         unique_indexes: dict[str, Callable[[T], Hashable]] | None = None,
+        secondary_indexes: dict[str, Callable[[T], Hashable]] | None = None,
     ) -> None:
         self._id_getter = id_getter
         self._items: dict[TId, T] = {}
         self._indexes: dict[str, dict[Hashable, TId]] = {k: {} for k in (unique_indexes or {})}
         self._extractors: dict[str, Callable[[T], Hashable]] = dict(unique_indexes or {})
+        self._secondary: dict[str, dict[Hashable, set[TId]]] = {k: {} for k in (secondary_indexes or {})}
+        self._secondary_extractors: dict[str, Callable[[T], Hashable]] = dict(secondary_indexes or {})
+
+    def _index_secondary(self, entity: T, eid: TId) -> None:
+        for name, ext in self._secondary_extractors.items():
+            self._secondary[name].setdefault(ext(entity), set()).add(eid)
+
+    def _unindex_secondary(self, entity: T, eid: TId) -> None:
+        for name, ext in self._secondary_extractors.items():
+            idx = self._secondary[name]
+            val = ext(entity)
+            ids = idx.get(val)
+            if ids is not None:
+                ids.discard(eid)
+                if not ids:
+                    idx.pop(val, None)
+
+    def _secondary_candidates(
+        self,
+        criteria: Mapping[str, Hashable | list[Hashable] | Mapping[str, Any]],
+    ) -> set[TId] | None:
+        candidates: set[TId] | None = None
+        for field, expected in criteria.items():
+            idx = self._secondary.get(field)
+            if idx is None:
+                continue
+            if is_multi_value(expected):
+                values = expected
+            elif is_range_dict(expected):
+                continue
+            else:
+                values = [expected]
+            if not all(isinstance(v, Hashable) for v in values):
+                continue
+            ids: set[TId] = set()
+            for v in values:
+                ids |= idx.get(v, set())
+            candidates = ids if candidates is None else candidates & ids
+        return candidates
 
     @override
     async def add(self, entity: T) -> None:
@@ -38,11 +85,17 @@ class MemoryRepository(Repository[T, TId], Generic[T, TId]):
         self._items[eid] = entity
         for name, ext in self._extractors.items():
             self._indexes[name][ext(entity)] = eid
+        self._index_secondary(entity, eid)
 
     @override
     async def get(self, entity_id: TId) -> Optional[T]:
         return self._items.get(entity_id)
 
+    @override
+    async def get_many(self, ids: Sequence[TId]) -> dict[TId, T]:
+        items = self._items
+        return {eid: items[eid] for eid in dict.fromkeys(ids) if eid in items}
+
     @override
     async def list(
         self,
@@ -52,20 +105,28 @@ class MemoryRepository(Repository[T, TId], Generic[T, TId]):
         sort_by: str | None = None,
         sort_desc: bool = False,
     ) -> Sequence[T]:
-        vals = list(self._items.values())
         if sort_by is not None:
-            vals.sort(
-                key=lambda e: _get_field_value(e, sort_by),
-                reverse=sort_desc,
+            getter = _field_getter(next(iter(self._items.values()))) if self._items else _get_field_value
+            picker = heapq.nlargest if sort_desc else heapq.nsmallest
+            top = picker(
+                offset + limit,
+                self._items.values(),
+                key=lambda e: getter(e, sort_by),
             )
+            return top[offset:]
+        vals = list(self._items.values())
         return vals[offset: offset + limit]
 
     @override
     async def update(self, entity: T) -> None:
         eid = self._id_getter(entity)
+        old = self._items.get(eid)
+        if old is not None:
+            self._unindex_secondary(old, eid)
         self._items[eid] = entity
         for name, ext in self._extractors.items():
             self._indexes[name][ext(entity)] = eid
+        self._index_secondary(entity, eid)
 
     @override
     async def delete(self, entity_id: TId) -> None:
@@ -77,6 +138,7 @@ class MemoryRepository(Repository[T, TId], Generic[T, TId]):
             idx = self._indexes[name]
             if idx.get(val) == entity_id:
                 idx.pop(val, None)
+        self._unindex_secondary(ent, entity_id)
 
     @override
     async def get_by_index(self, index: str, value: Hashable) -> Optional[T]:
@@ -117,13 +179,31 @@ class MemoryRepository(Repository[T, TId], Generic[T, TId]):
                 return []
             if is_range_dict(v) and v.get("in") == []:
                 return []
-        matched: list[T] = []
-        for ent in self._items.values():
-            if match_criteria(criteria, lambda field: _get_field_value(ent, field)):
-                matched.append(ent)
+        matches = compile_criteria(criteria)
+        candidates = self._secondary_candidates(criteria)
+        getter = _field_getter(next(iter(self._items.values()))) if self._items else _get_field_value
+
+        def _iter_matches():
+            if candidates is None:
+                pool = self._items.items()
+            else:
+                pool = ((eid, ent) for eid, ent in self._items.items() if eid in candidates)
+            for _, ent in pool:
+                if matches(lambda field, ent=ent: getter(ent, field)):
+                    yield ent
+
+        if sort_by is not None and limit is not None:
+            picker = heapq.nlargest if sort_desc else heapq.nsmallest
+            top = picker(
+                offset + limit,
+                _iter_matches(),
+                key=lambda e: getter(e, sort_by),
+            )
+            return top[offset:]
+        matched = list(_iter_matches())
         if sort_by is not None:
             matched.sort(
-                key=lambda e: _get_field_value(e, sort_by),
+                key=lambda e: getter(e, sort_by),
                 reverse=sort_desc,
             )
         if offset:
@@ -132,6 +212,11 @@ class MemoryRepository(Repository[T, TId], Generic[T, TId]):
             matched = matched[:limit]
         return matched
 
+    @override
+    async def list_by_ids(self, ids: Sequence[TId]) -> Sequence[T]:
+        items = self._items
+        return [items[i] for i in ids if i in items]
+
     @override
     async def distinct_values(
         self,
@@ -1,8 +1,61 @@
-from dataclasses import asdict, is_dataclass, fields
-from typing import Any, Mapping, Type, TypeVar
+from dataclasses import MISSING, asdict, is_dataclass
+from typing import Any, Callable, Mapping, Type, TypeVar, get_args
+
+from persistence_kit.repository.dataclass_fields import field_info, field_name_set, resolved_field_types
 
 T = TypeVar("T")
 
+
+def _is_nested_dataclass(tp: Any) -> bool:
+    if isinstance(tp, str):
+        # Anotación sin resolver (PEP 563): decidir en tiempo de ejecución vía _nested_value.
+        return True
+    if is_dataclass(tp):
+        return True
+    return any(is_dataclass(arg) for arg in get_args(tp))
+
+
+def _has_default(f: Any) -> bool:
+    return f.default is not MISSING or f.default_factory is not MISSING
+
+
+def _nested_value(value: Any) -> Any:
+    if is_dataclass(value) and not isinstance(value, type):
+        return asdict(value)
+    if isinstance(value, (list, tuple)):
+        return [asdict(item) if is_dataclass(item) else item for item in value]
+    return value
+
+
+def _compile_to_document(entity_type: type, writable: tuple[str, ...], nested: frozenset[str]) -> Callable:
+    parts = []
+    for n in writable:
+        if n in nested:
+            parts.append(f"{n!r}: _nested(e.{n})")
+        else:
+            parts.append(f"{n!r}: e.{n}")
+    src = "def _to_document(e):\n    return {" + ", ".join(parts) + "}"
+    ns: dict[str, Any] = {"_nested": _nested_value}
+    exec(compile(src, f"<to_document:{entity_type.__name__}>", "exec"), ns)
+    return ns["_to_document"]
+
+
+def _compile_from_document(entity_type: Type[T], id_field: str) -> Callable:
+    lines = ["def _from_document(doc):", f"    data = {{'id': doc[{id_field!r}]}}"]
+    for f in field_info(entity_type)[1]:
+        if f.name == "id":
+            continue
+        if _has_default(f):
+            lines.append(f"    if {f.name!r} in doc:")
+            lines.append(f"        data[{f.name!r}] = doc[{f.name!r}]")
+        else:
+            lines.append(f"    data[{f.name!r}] = doc[{f.name!r}]")
+    lines.append("    return _entity(**data)")
+    ns: dict[str, Any] = {"_entity": entity_type}
+    exec(compile("\n".join(lines), f"<from_document:{entity_type.__name__}>", "exec"), ns)
+    return ns["_from_document"]
+
+
 class DataclassMapper:
     def __init__(
         self,
@@ -17,7 +70,17 @@ class DataclassMapper:
         self._collection_name = collection_name
         self._id_field = id_field
         self._unique_fields = dict(unique_fields or {})
-        self._field_names = {f.name for f in fields(entity_type)}
+        names, fs = field_info(entity_type)
+        self._field_names = field_name_set(entity_type)
+        self._writable_fields = tuple(n for n in names if n != "id")
+        field_types = resolved_field_types(entity_type)
+        self._nested_fields = frozenset(
+            n for n in names if n != "id" and _is_nested_dataclass(field_types[n])
+        )
+        self._attr_set = self._field_names | {"id"}
+        self._attr_to_storage_map = {**{n: n for n in names}, "id": id_field}
+        self.to_document = _compile_to_document(entity_type, self._writable_fields, self._nested_fields)
+        self.from_document = _compile_from_document(entity_type, id_field)
 
     def collection(self) -> str:
         return self._collection_name
@@ -25,17 +88,6 @@ class DataclassMapper:
     def id_of(self, entity: T):
         return getattr(entity, "id")
 
-    def to_document(self, entity: T) -> dict:
-        d = asdict(entity)
-        d.pop("id", None)
-        return {k: v for k, v in d.items() if k in self._field_names}
-
-    def from_document(self, doc: Mapping[str, Any]) -> T:
-        data = dict(doc)
-        data["id"] = data.pop(self._id_field)
-        data = {k: v for k, v in data.items() if k in self._field_names}
-        return self._entity_type(**data)
-
     def id_field(self) -> str:
         return self._id_field
 
@@ -43,9 +95,10 @@ class DataclassMapper:
         return self._unique_fields
 
     def has_attr(self, name: str) -> bool:
-        return name == "id" or name in self._field_names
+        return name in self._attr_set
 
     def attr_to_storage(self, name: str) -> str:
-        if name == "id":
-            return self._id_field
-        return name
+        return self._attr_to_storage_map.get(name, name)
+
+    def attr_to_storage_map(self) -> Mapping[str, str]:
+        return self._attr_to_storage_map
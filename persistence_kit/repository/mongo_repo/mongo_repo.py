@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Optional, Sequence, TypeVar, Generic, Hashable, Mapping, Protocol, Any
+from typing import AsyncIterator, Callable, Optional, Sequence, TypeVar, Generic, Hashable, Mapping, Protocol, Any
 try:
     from typing import override
 except ImportError:
@@ -31,8 +31,14 @@ class EntityMapper(Protocol[T, TId]):
     def has_attr(self, name: str) -> bool: ...
     def attr_to_storage(self, name: str) -> str: ...
 
+def _storage_lookup(mapper: EntityMapper[T, TId]) -> Callable[[str, str], str]:
+    storage_map = getattr(mapper, "attr_to_storage_map", None)
+    if storage_map is not None:
+        return storage_map().get
+    return lambda name, default: mapper.attr_to_storage(name)
+
 def _normalize_field(mapper: EntityMapper[T, TId], field: str) -> str:
-    return mapper.attr_to_storage(field)
+    return _storage_lookup(mapper)(field, field)
 
 def _range_to_mongo(value: Mapping[str, Any]) -> Mapping[str, Any]:
     query: dict[str, Any] = {}
@@ -78,13 +84,16 @@ def _build_query(
 ) -> dict[str, Any] | None:
     if not criteria:
         return {}
+    _is_multi = is_multi_value
+    _is_range = is_range_dict
     for v in criteria.values():
-        if is_multi_value(v) and not v:
+        if _is_multi(v) and not v:
             return None
-        if is_range_dict(v) and v.get("in") == []:
+        if _is_range(v) and v.get("in") == []:
             return None
 
     query: dict[str, Any] = {}
+    get_storage = _storage_lookup(mapper)
     for k, v in criteria.items():
         if is_logical_key(k):
             rendered_groups: list[dict[str, Any]] = []
@@ -97,12 +106,12 @@ def _build_query(
                 return None
             query[f"${k}"] = rendered_groups
             continue
-        f = _normalize_field(mapper, k)
+        f = get_storage(k, k)
         if v is None:
             query[f] = {"$eq": None}
-        elif is_multi_value(v):
+        elif _is_multi(v):
             query[f] = {"$in": list(v)}
-        elif is_range_dict(v):
+        elif _is_range(v):
             mongo_range = _range_to_mongo(v)
             if not mongo_range:
                 return None
@@ -111,7 +120,12 @@ def _build_query(
             query[f] = v
     return query
 
-async def _find_by_fields(
+async def _iter_find(cursor, from_doc: Callable[[Mapping], T]) -> AsyncIterator[T]:
+    async for d in cursor:
+        yield from_doc(d)
+
+
+def _find_cursor(
     col: AsyncIOMotorCollection,
     mapper: EntityMapper[T, TId],
     criteria: Mapping[str, Hashable | list[Hashable] | Mapping[str, Any]],
@@ -120,12 +134,12 @@ async def _find_by_fields(
     limit: Optional[int] = 50,
     sort_by: str | None = None,
     sort_desc: bool = False,
-) -> Sequence[T]:
+):
     if not criteria:
-        return []
+        return None
     query = _build_query(mapper, criteria)
     if query is None:
-        return []
+        return None
 
     cursor = col.find(query)
 
@@ -140,9 +154,25 @@ async def _find_by_fields(
         cursor = cursor.skip(offset)
     if limit is not None:
         cursor = cursor.limit(limit)
+    return cursor
 
-    docs = await cursor.to_list(length=0 if limit is None else limit)
-    return [mapper.from_document(d) for d in docs]
+
+async def _find_by_fields(
+    col: AsyncIOMotorCollection,
+    mapper: EntityMapper[T, TId],
+    criteria: Mapping[str, Hashable | list[Hashable] | Mapping[str, Any]],
+    *,
+    offset: int = 0,
+    limit: Optional[int] = 50,
+    sort_by: str | None = None,
+    sort_desc: bool = False,
+) -> Sequence[T]:
+    cursor = _find_cursor(
+        col, mapper, criteria, offset=offset, limit=limit, sort_by=sort_by, sort_desc=sort_desc
+    )
+    if cursor is None:
+        return []
+    return [entity async for entity in _iter_find(cursor, mapper.from_document)]
 
 class MongoRepository(Repository[T, TId], Generic[T, TId]):
     def __init__(self, db: AsyncIOMotorDatabase, mapper: EntityMapper[T, TId]) -> None:
@@ -172,6 +202,19 @@ class MongoRepository(Repository[T, TId], Generic[T, TId]):
         doc[self._mapper.id_field()] = eid
         await self._col.insert_one(doc)
 
+    @override
+    async def add_many(self, entities: Sequence[T]) -> None:
+        await self._ensure_indexes()
+        if not entities:
+            return
+        id_field = self._mapper.id_field()
+        docs = []
+        for entity in entities:
+            doc = self._mapper.to_document(entity)
+            doc[id_field] = self._mapper.id_of(entity)
+            docs.append(doc)
+        await self._col.insert_many(docs)
+
     @override
     async def get(self, entity_id: TId) -> Optional[T]:
         await self._ensure_indexes()
@@ -199,8 +242,7 @@ class MongoRepository(Repository[T, TId], Generic[T, TId]):
             cursor = cursor.sort(field, direction)
 
         cursor = cursor.skip(offset).limit(limit)
-        docs = await cursor.to_list(length=limit)
-        return [self._mapper.from_document(d) for d in docs]
+        return [entity async for entity in _iter_find(cursor, self._mapper.from_document)]
 
     @override
     async def update(self, entity: T) -> None:
@@ -263,6 +305,38 @@ class MongoRepository(Repository[T, TId], Generic[T, TId]):
             sort_desc=sort_desc,
         )
 
+    @override
+    async def list_by_ids(self, ids: Sequence[TId]) -> Sequence[T]:
+        await self._ensure_indexes()
+        if not ids:
+            return []
+        cursor = self._col.find({self._mapper.id_field(): {"$in": list(ids)}})
+        return [entity async for entity in _iter_find(cursor, self._mapper.from_document)]
+
+    async def list_by_fields_iter(
+        self,
+        criteria: Mapping[str, Hashable | list[Hashable] | Mapping[str, Any]],
+        *,
+        offset: int = 0,
+        limit: Optional[int] = 50,
+        sort_by: str | None = None,
+        sort_desc: bool = False,
+    ) -> AsyncIterator[T]:
+        await self._ensure_indexes()
+        cursor = _find_cursor(
+            self._col,
+            self._mapper,
+            criteria,
+            offset=offset,
+            limit=limit,
+            sort_by=sort_by,
+            sort_desc=sort_desc,
+        )
+        if cursor is None:
+            return
+        async for entity in _iter_find(cursor, self._mapper.from_document):
+            yield entity
+
     @override
     async def distinct_values(
         self,
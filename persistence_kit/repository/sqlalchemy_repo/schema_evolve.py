@@ -1,8 +1,8 @@
 import hashlib
 
-from dataclasses import fields as dc_fields
 from sqlalchemy import inspect, text
 from sqlalchemy.dialects import postgresql
+from persistence_kit.repository.dataclass_fields import field_info
 from persistence_kit.repository.sqlalchemy_repo.table_factory import _unwrap_optional, _sa_type
 
 
@@ -16,7 +16,7 @@ def _safe_identifier(name: str, limit: int = 63) -> str:
 def ensure_missing_columns(sync_conn, table, entity_type):
     inspector = inspect(sync_conn)
     existing = {c["name"] for c in inspector.get_columns(table.name)}
-    for f in dc_fields(entity_type):
+    for f in field_info(entity_type)[1]:
         col = f.name
         if col in existing:
             continue
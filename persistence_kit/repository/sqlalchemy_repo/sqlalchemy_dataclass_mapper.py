@@ -1,13 +1,49 @@
-from dataclasses import asdict, is_dataclass, fields
-from typing import Any, Mapping, Type, TypeVar, Generic
+from dataclasses import is_dataclass
+from typing import Any, Callable, Mapping, Type, TypeVar, Generic
 from enum import Enum
 import datetime
 
 from sqlalchemy import Table
 
+from persistence_kit.repository.dataclass_fields import field_info, field_name_set, resolved_field_types
+from persistence_kit.repository.sqlalchemy_repo.table_factory import _unwrap_optional
+
 T = TypeVar("T")
 
 
+def _convert_value(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    return value
+
+
+def _row_field_expr(name: str, tp: Any) -> str:
+    if isinstance(tp, str):
+        # Anotación sin resolver (PEP 563): convertir en tiempo de ejecución.
+        return f"_convert(e.{name})"
+    ft, is_optional = _unwrap_optional(tp)
+    if isinstance(ft, type) and issubclass(ft, Enum):
+        converted = f"e.{name}.value"
+    elif isinstance(ft, type) and issubclass(ft, datetime.date):
+        converted = f"e.{name}.isoformat()"
+    else:
+        return f"e.{name}"
+    if is_optional:
+        return f"({converted} if e.{name} is not None else None)"
+    return converted
+
+
+def _compile_to_row(entity_type: type) -> Callable:
+    field_types = resolved_field_types(entity_type)
+    parts = [f"{n!r}: {_row_field_expr(n, tp)}" for n, tp in field_types.items()]
+    src = "def _to_row(e):\n    return {" + ", ".join(parts) + "}"
+    ns: dict[str, Any] = {"_convert": _convert_value}
+    exec(compile(src, f"<to_row:{entity_type.__name__}>", "exec"), ns)
+    return ns["_to_row"]
+
+
 class SqlDataclassMapper(Generic[T]):
     def __init__(
         self,
@@ -22,7 +58,12 @@ class SqlDataclassMapper(Generic[T]):
         self._table = table
         self._id_column = id_column
         self._unique_cols = dict(unique_cols or {})
-        self._field_names = {f.name for f in fields(entity_type)}
+        self._field_names = field_name_set(entity_type)
+        self._field_order = field_info(entity_type)[0]
+        self._attr_set = self._field_names | {"id"}
+        self._attr_to_storage_map = {**{n: n for n in self._field_order}, "id": id_column}
+        self._tuple_plans: dict[tuple[str, ...], tuple[tuple[str, int], ...]] = {}
+        self.to_row = _compile_to_row(entity_type)
 
     def table(self) -> Table:
         return self._table
@@ -30,22 +71,39 @@ class SqlDataclassMapper(Generic[T]):
     def id_of(self, entity: T):
         return getattr(entity, "id")
 
-    def to_row(self, entity: T) -> Mapping[str, Any]:
-        data = asdict(entity)
-        for k, v in data.items():
-            if isinstance(v, Enum):
-                data[k] = v.value
-            elif isinstance(v, datetime.date):
-                data[k] = v.isoformat()
-        return data
-
     def from_row(self, row: Mapping[str, Any]) -> T:
-        data = dict(row)
-        if "id" not in data and self._id_column in data:
-            data["id"] = data[self._id_column]
-        data = {k: v for k, v in data.items() if k in self._field_names}
+        data = {n: row[n] for n in self._field_order if n in row}
+        if "id" not in data and self._id_column in row:
+            data["id"] = row[self._id_column]
         return self._entity_type(**data)
 
+    def to_row_with_id(self, entity: T) -> dict[str, Any]:
+        row = self.to_row(entity)
+        row[self._id_column] = getattr(entity, "id")
+        return row
+
+    def to_row_without_id(self, entity: T) -> dict[str, Any]:
+        row = self.to_row(entity)
+        row.pop(self._id_column, None)
+        return row
+
+    def from_row_tuple(self, cols: tuple[str, ...], row: Any) -> T:
+        plan = self._tuple_plans.get(cols)
+        if plan is None:
+            positions = {name: i for i, name in enumerate(cols)}
+            pairs = [(n, positions[n]) for n in self._field_order if n in positions]
+            if "id" not in positions and self._id_column in positions:
+                pairs.append(("id", positions[self._id_column]))
+            plan = tuple(pairs)
+            self._tuple_plans[cols] = plan
+        return self._entity_type(**{n: row[i] for n, i in plan})
+
+    def projection(self) -> tuple[str, ...]:
+        names = [self._attr_to_storage_map.get(n, n) for n in self._field_order]
+        if self._id_column not in names:
+            names.append(self._id_column)
+        return tuple(names)
+
     def id_column(self) -> str:
         return self._id_column
 
@@ -56,9 +114,10 @@ class SqlDataclassMapper(Generic[T]):
         return self._entity_type
 
     def has_attr(self, name: str) -> bool:
-        return name == "id" or name in self._field_names
+        return name in self._attr_set
 
     def attr_to_storage(self, name: str) -> str:
-        if name == "id":
-            return self._id_column
-        return name
+        return self._attr_to_storage_map.get(name, name)
+
+    def attr_to_storage_map(self) -> Mapping[str, str]:
+        return self._attr_to_storage_map
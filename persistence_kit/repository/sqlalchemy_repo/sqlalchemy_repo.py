@@ -1,13 +1,19 @@
 from __future__ import annotations
 
-from typing import Any, Optional, Sequence, TypeVar, Generic, Hashable, Mapping, Protocol
+from typing import Any, AsyncIterator, Callable, Optional, Sequence, TypeVar, Generic, Hashable, Mapping, Protocol
 try:
     from typing import override
 except ImportError:
     from typing_extensions import override
 
-from sqlalchemy import Table, select, insert, update as sql_update, delete as sql_delete, Index, and_, or_, func, distinct
-from sqlalchemy.ext.asyncio import AsyncEngine
+import asyncio
+import logging
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+
+from sqlalchemy import Table, bindparam, select, insert, update as sql_update, delete as sql_delete, Index, and_, or_, func, distinct
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
 
 from persistence_kit.contracts.repository import Repository
 from persistence_kit.repository.filter_ops import (
@@ -23,9 +29,56 @@ from persistence_kit.repository.sqlalchemy_repo.schema_evolve import (
 )
 from persistence_kit.repository_factory.registry.entity_registry import build_fk_map_from_registry
 
+logger = logging.getLogger(__name__)
+
 T = TypeVar("T")
 TId = TypeVar("TId", bound=Hashable)
 
+_current_conn: ContextVar[Optional[tuple[AsyncEngine, AsyncConnection]]] = ContextVar(
+    "pk_sqlalchemy_conn", default=None
+)
+
+_EXECUTEMANY_CHUNK = 1000
+_STREAM_CHUNK = 500
+
+_SCHEMA_READY: set[tuple[str, str]] = set()
+_SCHEMA_LOCKS: dict[tuple[str, str], asyncio.Lock] = {}
+
+
+def in_active_unit_of_work() -> bool:
+    return _current_conn.get() is not None
+
+
+@asynccontextmanager
+async def unit_of_work(engine: AsyncEngine):
+    ambient = _current_conn.get()
+    if ambient is not None and ambient[0] is engine:
+        yield ambient[1]
+        return
+    async with engine.begin() as conn:
+        token = _current_conn.set((engine, conn))
+        try:
+            yield conn
+        finally:
+            _current_conn.reset(token)
+
+
+@asynccontextmanager
+async def _connection(engine: AsyncEngine):
+    ambient = _current_conn.get()
+    if ambient is not None and ambient[0] is engine:
+        yield ambient[1]
+        return
+    async with engine.begin() as conn:
+        yield conn
+
+
+def _rows_to_entities(res: Any, mapper: "SqlAlchemyEntityMapper[T, TId]", cols: tuple[str, ...]) -> list[T]:
+    from_row_tuple = getattr(mapper, "from_row_tuple", None)
+    if from_row_tuple is not None:
+        return [from_row_tuple(cols, r) for r in res.all()]
+    return [mapper.from_row(dict(r)) for r in res.mappings().all()]
+
 
 class SqlAlchemyEntityMapper(Protocol[T, TId]):
     def table(self) -> Table: ...
@@ -39,6 +92,24 @@ class SqlAlchemyEntityMapper(Protocol[T, TId]):
     def attr_to_storage(self, name: str) -> str: ...
 
 
+_SQL_OPS: dict[str, Callable[[Any, Any], Any]] = {
+    "between": lambda col, v: col.between(v[0], v[1]),
+    "gte": lambda col, v: col >= v,
+    "gt": lambda col, v: col > v,
+    "lte": lambda col, v: col <= v,
+    "lt": lambda col, v: col < v,
+    "in": lambda col, v: col.in_(v),
+    "eq": lambda col, v: col == v,
+    "ne": lambda col, v: col != v,
+    "contains": lambda col, v: col.contains(str(v)),
+    "icontains": lambda col, v: col.ilike(f"%{v}%"),
+    "startswith": lambda col, v: col.startswith(str(v)),
+    "istartswith": lambda col, v: col.ilike(f"{v}%"),
+    "endswith": lambda col, v: col.endswith(str(v)),
+    "iendswith": lambda col, v: col.ilike(f"%{v}"),
+}
+
+
 def _build_where_clauses(
     table: Table,
     mapper: SqlAlchemyEntityMapper[T, TId],
@@ -53,7 +124,10 @@ def _build_where_clauses(
             return None
 
     clauses: list[Any] = []
-    for field, value in criteria.items():
+    has_attr = mapper.has_attr
+    attr_to_storage = mapper.attr_to_storage
+    table_cols = table.c
+    for field, value in sorted(criteria.items(), key=lambda item: item[0]):
         if is_logical_key(field):
             groups: list[Any] = []
             for group in iter_criteria_groups(value):
@@ -67,13 +141,13 @@ def _build_where_clauses(
                 return None
             clauses.append(or_(*groups) if field == "or" else and_(*groups))
             continue
-        if not mapper.has_attr(field):
+        if not has_attr(field):
             raise ValueError(
                 f"Field '{field}' is not a valid attribute for {mapper.entity_type().__name__}"
             )
-        col_name = mapper.attr_to_storage(field)
+        col_name = attr_to_storage(field)
         try:
-            col = table.c[col_name]
+            col = table_cols[col_name]
         except KeyError as e:
             raise ValueError(f"Column '{col_name}' does not exist on table '{table.name}'") from e
         if value is None:
@@ -81,45 +155,16 @@ def _build_where_clauses(
         elif is_multi_value(value):
             clauses.append(col.in_(list(value)))
         elif is_range_dict(value):
-            ops = list(iter_range_ops(value))
+            ops = sorted(iter_range_ops(value), key=lambda item: item[0])
             if not ops:
                 return None
-            for op, v in ops:
-                if op == "between":
-                    clauses.append(col.between(v[0], v[1]))
-                elif op == "gte":
-                    clauses.append(col >= v)
-                elif op == "gt":
-                    clauses.append(col > v)
-                elif op == "lte":
-                    clauses.append(col <= v)
-                elif op == "lt":
-                    clauses.append(col < v)
-                elif op == "in":
-                    clauses.append(col.in_(v))
-                elif op == "eq":
-                    clauses.append(col == v)
-                elif op == "ne":
-                    clauses.append(col != v)
-                elif op == "contains":
-                    clauses.append(col.contains(str(v)))
-                elif op == "icontains":
-                    clauses.append(col.ilike(f"%{v}%"))
-                elif op == "startswith":
-                    clauses.append(col.startswith(str(v)))
-                elif op == "istartswith":
-                    clauses.append(col.ilike(f"{v}%"))
-                elif op == "endswith":
-                    clauses.append(col.endswith(str(v)))
-                elif op == "iendswith":
-                    clauses.append(col.ilike(f"%{v}"))
+            clauses.extend(_SQL_OPS[op](col, v) for op, v in ops)
         else:
             clauses.append(col == value)
     return clauses
 
 
-async def _select_by_fields(
-    engine: AsyncEngine,
+def _build_select(
     mapper: SqlAlchemyEntityMapper[T, TId],
     criteria: Mapping[str, Hashable | list[Hashable] | Mapping[str, Any]],
     *,
@@ -127,15 +172,22 @@ async def _select_by_fields(
     limit: Optional[int] = 50,
     sort_by: str | None = None,
     sort_desc: bool = False,
-) -> Sequence[T]:
+) -> tuple[Any, tuple[str, ...]] | None:
+    if not criteria:
+        return None
     table = mapper.table()
     clauses = _build_where_clauses(table, mapper, criteria)
     if clauses is None:
-        return []
-    if not criteria:
-        return []
+        return None
 
-    stmt = select(table).where(and_(*clauses))
+    projection = getattr(mapper, "projection", None)
+    if projection is not None:
+        proj_cols = tuple(table.c[n] for n in projection() if n in table.c)
+    else:
+        proj_cols = tuple(table.c)
+    stmt = select(*proj_cols)
+    for clause in clauses:
+        stmt = stmt.where(clause)
 
     if sort_by is not None:
         if not mapper.has_attr(sort_by):
@@ -149,12 +201,29 @@ async def _select_by_fields(
 
     if limit is not None:
         stmt = stmt.limit(limit)
+    return stmt, tuple(c.name for c in proj_cols)
 
-    async with engine.begin() as conn:
-        res = await conn.execute(stmt)
-        rows = res.mappings().all()
 
-    return [mapper.from_row(dict(r)) for r in rows]
+async def _select_by_fields(
+    engine: AsyncEngine,
+    mapper: SqlAlchemyEntityMapper[T, TId],
+    criteria: Mapping[str, Hashable | list[Hashable] | Mapping[str, Any]],
+    *,
+    offset: int = 0,
+    limit: Optional[int] = 50,
+    sort_by: str | None = None,
+    sort_desc: bool = False,
+) -> Sequence[T]:
+    built = _build_select(
+        mapper, criteria, offset=offset, limit=limit, sort_by=sort_by, sort_desc=sort_desc
+    )
+    if built is None:
+        return []
+    stmt, col_names = built
+
+    async with _connection(engine) as conn:
+        res = await conn.execute(stmt)
+        return _rows_to_entities(res, mapper, col_names)
 
 
 async def _count_by_fields(
@@ -167,20 +236,113 @@ async def _count_by_fields(
     if clauses is None:
         return 0
     stmt = select(func.count()).select_from(table)
-    if clauses:
-        stmt = stmt.where(and_(*clauses))
-    async with engine.begin() as conn:
+    for clause in clauses:
+        stmt = stmt.where(clause)
+    async with _connection(engine) as conn:
         res = await conn.execute(stmt)
         value = res.scalar_one()
     return int(value)
 
 
 class SqlAlchemyRepository(Repository[T, TId], Generic[T, TId]):
-    def __init__(self, engine: AsyncEngine, mapper: SqlAlchemyEntityMapper[T, TId], entity_key: str) -> None:
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        mapper: SqlAlchemyEntityMapper[T, TId],
+        entity_key: str,
+        row_cache_size: int = 0,
+        skip_unchanged_updates: bool = False,
+    ) -> None:
         self._engine = engine
         self._mapper = mapper
         self._entity_key = entity_key
+        dialect = getattr(engine, "dialect", None)
+        if dialect is not None and not getattr(dialect, "supports_statement_cache", True):
+            logger.warning(
+                "El dialecto %s no soporta la caché de sentencias de SQLAlchemy; "
+                "las consultas se recompilarán en cada llamada",
+                type(dialect).__name__,
+            )
         self._inited = False
+        self._init_lock = asyncio.Lock()
+        self._stmts: dict[Hashable, Any] = {}
+        self._table = mapper.table()
+        self._cols = tuple(c.name for c in self._table.c)
+        projection = getattr(mapper, "projection", None)
+        if projection is not None:
+            self._proj_cols = tuple(self._table.c[n] for n in projection() if n in self._table.c)
+        else:
+            self._proj_cols = tuple(self._table.c)
+        self._proj_names = tuple(c.name for c in self._proj_cols)
+        self._id_column = mapper.id_column()
+        self._id_col = self._table.c[self._id_column]
+        self._unique_cols = dict(mapper.unique_columns())
+        self._has_attr = mapper.has_attr
+        self._attr_to_storage = mapper.attr_to_storage
+        storage_map = getattr(mapper, "attr_to_storage_map", None)
+        self._storage_to_attr = (
+            {storage: attr for attr, storage in storage_map().items()} if storage_map is not None else {}
+        )
+        self._to_row_with_id = getattr(mapper, "to_row_with_id", None)
+        self._to_row_without_id = getattr(mapper, "to_row_without_id", None)
+        self._from_row_tuple = getattr(mapper, "from_row_tuple", None)
+        if skip_unchanged_updates and not row_cache_size:
+            raise ValueError("skip_unchanged_updates requires row_cache_size > 0")
+        self._row_cache_max = row_cache_size
+        self._row_cache: OrderedDict[tuple[str, Hashable], T] = OrderedDict()
+        self._skip_unchanged = skip_unchanged_updates
+        self._point_get_cache: dict[Any, Any] = {}
+        self._point_get_opts = {"compiled_cache": self._point_get_cache}
+
+    def _row_with_id(self, entity: T) -> dict[str, Any]:
+        if self._to_row_with_id is not None:
+            return self._to_row_with_id(entity)
+        row = dict(self._mapper.to_row(entity))
+        row[self._id_column] = self._mapper.id_of(entity)
+        return row
+
+    def _first_entity(self, res: Any) -> Optional[T]:
+        if self._from_row_tuple is not None:
+            row = res.first()
+            return self._from_row_tuple(self._proj_names, row) if row is not None else None
+        row = res.mappings().first()
+        return self._mapper.from_row(dict(row)) if row else None
+
+    def _row_without_id(self, entity: T) -> dict[str, Any]:
+        if self._to_row_without_id is not None:
+            return self._to_row_without_id(entity)
+        row = dict(self._mapper.to_row(entity))
+        row.pop(self._id_column, None)
+        return row
+
+    def _row_cache_get(self, key: tuple[str, Hashable]) -> Optional[T]:
+        cached = self._row_cache.get(key)
+        if cached is not None:
+            self._row_cache.move_to_end(key)
+        return cached
+
+    def _row_cache_put(self, key: tuple[str, Hashable], entity: T) -> None:
+        cache = self._row_cache
+        cache[key] = entity
+        cache.move_to_end(key)
+        while len(cache) > self._row_cache_max:
+            cache.popitem(last=False)
+
+    def _row_cache_invalidate(self, entity_id: Hashable) -> None:
+        if not self._row_cache:
+            return
+        self._row_cache.pop(("id", entity_id), None)
+        id_of = self._mapper.id_of
+        stale = [key for key, cached in self._row_cache.items() if id_of(cached) == entity_id]
+        for key in stale:
+            self._row_cache.pop(key, None)
+
+    def _cached_stmt(self, key: Hashable, build: Any) -> Any:
+        stmt = self._stmts.get(key)
+        if stmt is None:
+            stmt = build()
+            self._stmts[key] = stmt
+        return stmt
 
     async def init_indexes(self) -> None:
         table = self._mapper.table()
@@ -200,29 +362,101 @@ class SqlAlchemyRepository(Repository[T, TId], Generic[T, TId]):
             await conn.run_sync(_create_table_and_indexes)
         self._inited = True
 
+    def _schema_key(self) -> tuple[str, str] | None:
+        url = getattr(self._engine, "url", None)
+        if url is None:
+            return None
+        return (str(url), self._entity_key)
+
     async def _ensure_indexes(self) -> None:
-        if not self._inited:
+        if self._inited:
+            return
+        key = self._schema_key()
+        if key is not None and key in _SCHEMA_READY:
+            self._inited = True
+            return
+        lock = self._init_lock if key is None else _SCHEMA_LOCKS.setdefault(key, asyncio.Lock())
+        async with lock:
+            if self._inited:
+                return
+            if key is not None and key in _SCHEMA_READY:
+                self._inited = True
+                return
             await self.init_indexes()
+            if key is not None:
+                _SCHEMA_READY.add(key)
 
     @override
     async def add(self, entity: T) -> None:
         await self._ensure_indexes()
-        table = self._mapper.table()
-        row = dict(self._mapper.to_row(entity))
-        row[self._mapper.id_column()] = self._mapper.id_of(entity)
-        async with self._engine.begin() as conn:
-            await conn.execute(insert(table).values(row))
+        row = self._row_with_id(entity)
+        stmt = self._cached_stmt("insert", lambda: insert(self._table))
+        async with _connection(self._engine) as conn:
+            await conn.execute(stmt, row)
+        if self._row_cache_max:
+            self._row_cache_invalidate(self._mapper.id_of(entity))
+
+    @override
+    async def add_many(self, entities: Sequence[T]) -> None:
+        await self._ensure_indexes()
+        if not entities:
+            return
+        rows = [self._row_with_id(entity) for entity in entities]
+        stmt = self._cached_stmt("insert", lambda: insert(self._table))
+        async with _connection(self._engine) as conn:
+            for start in range(0, len(rows), _EXECUTEMANY_CHUNK):
+                await conn.execute(stmt, rows[start: start + _EXECUTEMANY_CHUNK])
+
+    @override
+    async def update_many(self, entities: Sequence[T]) -> None:
+        await self._ensure_indexes()
+        if not entities:
+            return
+        rows = []
+        cols: tuple[str, ...] | None = None
+        for entity in entities:
+            row = self._row_without_id(entity)
+            if not row:
+                continue
+            if cols is None:
+                cols = tuple(row)
+            row["pk"] = self._mapper.id_of(entity)
+            rows.append(row)
+        if not rows:
+            return
+
+        def _build():
+            return (
+                sql_update(self._table)
+                .where(self._id_col == bindparam("pk"))
+                .values({c: bindparam(c) for c in cols})
+            )
+
+        stmt = self._cached_stmt(("update", cols), _build)
+        async with _connection(self._engine) as conn:
+            for start in range(0, len(rows), _EXECUTEMANY_CHUNK):
+                await conn.execute(stmt, rows[start: start + _EXECUTEMANY_CHUNK])
+        if self._row_cache_max:
+            for row in rows:
+                self._row_cache_invalidate(row["pk"])
 
     @override
     async def get(self, entity_id: TId) -> Optional[T]:
         await self._ensure_indexes()
-        table = self._mapper.table()
-        id_col = table.c[self._mapper.id_column()]
-        stmt = select(table).where(id_col == entity_id).limit(1)
-        async with self._engine.begin() as conn:
-            res = await conn.execute(stmt)
-            row = res.mappings().first()
-        return self._mapper.from_row(dict(row)) if row else None
+        if self._row_cache_max:
+            cached = self._row_cache_get(("id", entity_id))
+            if cached is not None:
+                return cached
+        stmt = self._cached_stmt(
+            "get",
+            lambda: select(*self._proj_cols).where(self._id_col == bindparam("pk")).limit(1),
+        )
+        async with _connection(self._engine) as conn:
+            res = await conn.execute(stmt, {"pk": entity_id}, execution_options=self._point_get_opts)
+            entity = self._first_entity(res)
+        if entity is not None and self._row_cache_max:
+            self._row_cache_put(("id", entity_id), entity)
+        return entity
 
     @override
     async def list(
@@ -234,72 +468,111 @@ class SqlAlchemyRepository(Repository[T, TId], Generic[T, TId]):
         sort_desc: bool = False,
     ) -> Sequence[T]:
         await self._ensure_indexes()
-        table = self._mapper.table()
 
         if sort_by is not None:
-            if not self._mapper.has_attr(sort_by):
+            if not self._has_attr(sort_by):
                 raise ValueError(f"Invalid sort attribute: {sort_by}")
-            col_name = self._mapper.attr_to_storage(sort_by)
+            col_name = self._attr_to_storage(sort_by)
         else:
-            col_name = self._mapper.id_column()
-
-        col = table.c[col_name]
-        stmt = (
-            select(table)
-            .order_by(col.desc() if sort_desc else col.asc())
-            .offset(offset)
-            .limit(limit)
-        )
-
-        async with self._engine.begin() as conn:
-            res = await conn.execute(stmt)
-            rows = res.mappings().all()
+            col_name = self._id_column
+
+        def _build():
+            col = self._table.c[col_name]
+            return (
+                select(*self._proj_cols)
+                .order_by(col.desc() if sort_desc else col.asc())
+                .offset(bindparam("off"))
+                .limit(bindparam("lim"))
+            )
 
-        return [self._mapper.from_row(dict(r)) for r in rows]
+        stmt = self._cached_stmt(("list", col_name, sort_desc), _build)
+        async with _connection(self._engine) as conn:
+            res = await conn.execute(stmt, {"off": offset, "lim": limit})
+            return _rows_to_entities(res, self._mapper, self._proj_names)
 
     @override
     async def update(self, entity: T) -> None:
         await self._ensure_indexes()
-        table = self._mapper.table()
         eid = self._mapper.id_of(entity)
-        row = dict(self._mapper.to_row(entity))
-        row.pop(self._mapper.id_column(), None)
+        row = self._row_without_id(entity)
         if not row:
             return
-        id_col = table.c[self._mapper.id_column()]
-        stmt = sql_update(table).where(id_col == eid).values(**row)
-        async with self._engine.begin() as conn:
-            await conn.execute(stmt)
+        if self._skip_unchanged:
+            cached = self._row_cache.get(("id", eid))
+            if cached is not None and self._row_without_id(cached) == row:
+                return
+        cols = tuple(row)
+
+        def _build():
+            id_col = self._id_col
+            return (
+                sql_update(self._table)
+                .where(id_col == bindparam("pk"))
+                .values({c: bindparam(c) for c in cols})
+            )
+
+        stmt = self._cached_stmt(("update", cols), _build)
+        async with _connection(self._engine) as conn:
+            await conn.execute(stmt, {**row, "pk": eid})
+        if self._row_cache_max:
+            self._row_cache_invalidate(eid)
 
     @override
     async def delete(self, entity_id: TId) -> None:
         await self._ensure_indexes()
-        table = self._mapper.table()
-        id_col = table.c[self._mapper.id_column()]
-        stmt = sql_delete(table).where(id_col == entity_id)
-        async with self._engine.begin() as conn:
-            await conn.execute(stmt)
+        stmt = self._cached_stmt(
+            "delete",
+            lambda: sql_delete(self._table).where(self._id_col == bindparam("pk")),
+        )
+        async with _connection(self._engine) as conn:
+            await conn.execute(stmt, {"pk": entity_id})
+        if self._row_cache_max:
+            self._row_cache_invalidate(entity_id)
 
     @override
     async def get_by_index(self, index: str, value: Hashable) -> Optional[T]:
         await self._ensure_indexes()
-        col_name = self._mapper.unique_columns().get(index)
+        col_name = self._unique_cols.get(index)
         if not col_name:
             return None
-        table = self._mapper.table()
-        col = table.c[col_name]
-        stmt = select(table).where(col == value).limit(1)
-        async with self._engine.begin() as conn:
+        if self._row_cache_max:
+            cached = self._row_cache_get((index, value))
+            if cached is not None:
+                return cached
+        stmt = self._cached_stmt(
+            ("index", col_name),
+            lambda: select(*self._proj_cols).where(self._table.c[col_name] == bindparam("value")).limit(1),
+        )
+        async with _connection(self._engine) as conn:
+            res = await conn.execute(stmt, {"value": value}, execution_options=self._point_get_opts)
+            entity = self._first_entity(res)
+        if entity is not None and self._row_cache_max:
+            self._row_cache_put((index, value), entity)
+        return entity
+
+    @override
+    async def get_many_by_index(self, index: str, values: Sequence[Hashable]) -> dict[Hashable, T]:
+        await self._ensure_indexes()
+        col_name = self._unique_cols.get(index)
+        if not col_name or not values:
+            return {}
+        stmt = select(*self._proj_cols).where(self._table.c[col_name].in_(list(dict.fromkeys(values))))
+        async with _connection(self._engine) as conn:
             res = await conn.execute(stmt)
-            row = res.mappings().first()
-        return self._mapper.from_row(dict(row)) if row else None
+            entities = _rows_to_entities(res, self._mapper, self._proj_names)
+        attr_name = self._storage_to_attr.get(col_name, col_name)
+        out: dict[Hashable, T] = {}
+        for entity in entities:
+            key = entity.get(attr_name) if isinstance(entity, dict) else getattr(entity, attr_name, None)
+            if key is not None:
+                out[key] = entity
+        return out
 
     @override
     async def count(self) -> int:
         await self._ensure_indexes()
-        table = self._mapper.table()
-        stmt = select(func.count()).select_from(table)
-        async with self._engine.begin() as conn:
+        stmt = self._cached_stmt("count", lambda: select(func.count()).select_from(self._table))
+        async with _connection(self._engine) as conn:
             res = await conn.execute(stmt)
             value = res.scalar_one()
         return int(value)
@@ -335,6 +608,43 @@ class SqlAlchemyRepository(Repository[T, TId], Generic[T, TId]):
             sort_desc=sort_desc,
         )
 
+    async def iter_by_fields(
+        self,
+        criteria: Mapping[str, Hashable | list[Hashable] | Mapping[str, Any]],
+        *,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        sort_by: str | None = None,
+        sort_desc: bool = False,
+    ) -> AsyncIterator[T]:
+        await self._ensure_indexes()
+        built = _build_select(
+            self._mapper, criteria, offset=offset, limit=limit, sort_by=sort_by, sort_desc=sort_desc
+        )
+        if built is None:
+            return
+        stmt, col_names = built
+        stmt = stmt.execution_options(yield_per=_STREAM_CHUNK, stream_results=True)
+        from_row_tuple = getattr(self._mapper, "from_row_tuple", None)
+        async with self._engine.connect() as conn:
+            result = await conn.stream(stmt)
+            if from_row_tuple is not None:
+                async for row in result:
+                    yield from_row_tuple(col_names, row)
+            else:
+                async for mapping in result.mappings():
+                    yield self._mapper.from_row(dict(mapping))
+
+    @override
+    async def list_by_ids(self, ids: Sequence[TId]) -> Sequence[T]:
+        await self._ensure_indexes()
+        if not ids:
+            return []
+        stmt = select(*self._proj_cols).where(self._id_col.in_(list(ids)))
+        async with _connection(self._engine) as conn:
+            res = await conn.execute(stmt)
+            return _rows_to_entities(res, self._mapper, self._proj_names)
+
     @override
     async def distinct_values(
         self,
@@ -342,19 +652,19 @@ class SqlAlchemyRepository(Repository[T, TId], Generic[T, TId]):
         criteria: Mapping[str, Hashable | list[Hashable] | Mapping[str, Any]] | None = None,
     ) -> Sequence[Any]:
         await self._ensure_indexes()
-        if not self._mapper.has_attr(field):
+        if not self._has_attr(field):
             raise ValueError(f"Invalid distinct attribute: {field}")
-        table = self._mapper.table()
-        col_name = self._mapper.attr_to_storage(field)
+        table = self._table
+        col_name = self._attr_to_storage(field)
         col = table.c[col_name]
         stmt = select(distinct(col))
         if criteria:
             clauses = _build_where_clauses(table, self._mapper, criteria)
             if clauses is None:
                 return []
-            if clauses:
-                stmt = stmt.where(and_(*clauses))
-        async with self._engine.begin() as conn:
+            for clause in clauses:
+                stmt = stmt.where(clause)
+        async with _connection(self._engine) as conn:
             res = await conn.execute(stmt)
             values = res.scalars().all()
         return [value for value in values if value is not None]
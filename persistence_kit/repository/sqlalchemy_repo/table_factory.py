@@ -1,4 +1,5 @@
-from dataclasses import is_dataclass, fields as dc_fields
+from dataclasses import is_dataclass
+from functools import lru_cache
 from typing import Any, get_origin, get_args, Union
 import types
 from enum import Enum
@@ -7,6 +8,8 @@ from sqlalchemy.dialects.postgresql import UUID as PGUUID, ARRAY
 import uuid
 import datetime
 
+from persistence_kit.repository.dataclass_fields import field_info
+
 metadata = MetaData()
 
 def _unwrap_optional(tp: Any) -> tuple[Any, bool]:
@@ -24,20 +27,29 @@ def _is_list_of(tp: Any, inner: Any) -> bool:
         return len(args) == 1 and args[0] is inner
     return False
 
+_SA_TYPE_MAP: dict[Any, Any] = {
+    uuid.UUID: PGUUID(as_uuid=True),
+    str: String,
+    bool: Boolean,
+    int: Integer,
+    float: Float,
+    datetime.datetime: DateTime,
+}
+
 def _sa_type(ft: Any):
-    if ft is uuid.UUID:
-        return PGUUID(as_uuid=True)
-    if ft is str:
-        return String
-    if ft is bool:
-        return Boolean
-    if ft is int:
-        return Integer
-    if ft is float:
-        return Float
-    if ft is datetime.datetime:
-        return DateTime
-    return String
+    return _SA_TYPE_MAP.get(ft, String)
+
+@lru_cache(maxsize=None)
+def _column_specs(entity_type: type) -> tuple[tuple[str, Any, bool], ...]:
+    specs: list[tuple[str, Any, bool]] = []
+    for f in field_info(entity_type)[1]:
+        ft, is_optional = _unwrap_optional(f.type)
+        if _is_list_of(ft, uuid.UUID):
+            specs.append((f.name, ARRAY(PGUUID(as_uuid=True)), True))
+        else:
+            specs.append((f.name, _sa_type(ft), is_optional))
+    return tuple(specs)
+
 
 def build_table_from_dataclass(entity_type: type, table_name: str, meta: MetaData | None = None) -> Table:
     if not is_dataclass(entity_type):
@@ -47,17 +59,10 @@ def build_table_from_dataclass(entity_type: type, table_name: str, meta: MetaDat
         return m.tables[table_name]
 
     cols = []
-    for f in dc_fields(entity_type):
-        ft, is_optional = _unwrap_optional(f.type)
-
-        if _is_list_of(ft, uuid.UUID):
-            cols.append(Column(f.name, ARRAY(PGUUID(as_uuid=True)), nullable=True))
-            continue
-
-        coltype = _sa_type(ft)
-        if f.name == "id":
-            cols.append(Column(f.name, coltype, primary_key=True))
+    for name, coltype, nullable in _column_specs(entity_type):
+        if name == "id":
+            cols.append(Column(name, coltype, primary_key=True))
         else:
-            cols.append(Column(f.name, coltype, nullable=is_optional))
+            cols.append(Column(name, coltype, nullable=nullable))
 
     return Table(table_name, m, *cols)
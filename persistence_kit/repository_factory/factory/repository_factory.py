@@ -44,17 +44,32 @@ def _to_memory_unique(unique: dict | None) -> dict[str, Callable[[T], Any]]:
     return out
 
 
+@lru_cache
+def _memory_unique(entity_key: str) -> dict[str, Callable[[Any], Any]]:
+    return _to_memory_unique(get_entity_config(entity_key).get("unique"))
+
+
+@lru_cache
+def _unique_storage_map(entity_key: str) -> dict[str, str]:
+    return {
+        key: (value if isinstance(value, str) else key)
+        for key, value in (get_entity_config(entity_key).get("unique") or {}).items()
+    }
+
+
 @lru_cache
 def _mongo_db(dsn: str, dbname: str) -> AsyncIOMotorDatabase:
     return AsyncIOMotorClient(dsn, uuidRepresentation="standard")[dbname]
 
 
+_DB_BY_VALUE = {db.value: db for db in Database}
+
+
 def _normalize_database(value: Any, default_database: Database) -> Database:
     if isinstance(value, Database):
         return value
     if isinstance(value, str):
-        normalized = value.strip().lower()
-        return Database(normalized) if normalized in {db.value for db in Database} else default_database
+        return _DB_BY_VALUE.get(value.strip().lower(), default_database)
     return default_database
 
 
@@ -68,7 +83,7 @@ def _repo_cached(entity_key: str, resolved: Database) -> Repository[Any, UUID]:
     if resolved is Database.MEMORY:
         return MemoryRepository[Any, UUID](
             id_getter=lambda e: e.id,
-            unique_indexes=_to_memory_unique(config.get("unique")),
+            unique_indexes=_memory_unique(entity_key),
         )
 
     if resolved is Database.MONGO:
@@ -76,10 +91,7 @@ def _repo_cached(entity_key: str, resolved: Database) -> Repository[Any, UUID]:
         mapper = DataclassMapper(
             entity_type,
             config["collection"],
-            unique_fields={
-                key: (value if isinstance(value, str) else key)
-                for key, value in (config.get("unique") or {}).items()
-            },
+            unique_fields=_unique_storage_map(entity_key),
         )
         return MongoRepository[Any, UUID](db, mapper)
 
@@ -89,10 +101,7 @@ def _repo_cached(entity_key: str, resolved: Database) -> Repository[Any, UUID]:
         dynamo_mapper = DynamoMapper(
             entity_type,
             table_name,
-            unique_fields={
-                key: (value if isinstance(value, str) else key)
-                for key, value in (config.get("unique") or {}).items()
-            },
+            unique_fields=_unique_storage_map(entity_key),
         )
         return DynamoRepository[Any, UUID](
             table_name, dynamo_mapper, region=settings.dynamodb_region
@@ -106,30 +115,42 @@ def _repo_cached(entity_key: str, resolved: Database) -> Repository[Any, UUID]:
             entity_type,
             table,
             id_column="id",
-            unique_cols={
-                key: (value if isinstance(value, str) else key)
-                for key, value in (config.get("unique") or {}).items()
-            },
+            unique_cols=_unique_storage_map(entity_key),
         )
         return SqlAlchemyRepository[Any, UUID](engine, mapper, entity_key)
 
     raise ValueError(f"Database {resolved} no soportado: {entity_key}")
 
 
+_resolved: dict[str, Repository[Any, UUID]] = {}
+
+
 def get_repo(entity_key: str) -> Repository[Any, UUID]:
+    try:
+        return _resolved[entity_key]
+    except KeyError:
+        pass
     _init_registry()
     settings = RepoSettings()
     config = get_entity_config(entity_key)
     backend = _normalize_database(config.get("database"), settings.repo_database)
-    return _repo_cached(entity_key, backend)
+    repo = _repo_cached(entity_key, backend)
+    _resolved[entity_key] = repo
+    return repo
+
+
+@lru_cache
+def _view_repo_for(entity_key: str) -> ViewRepository[Any, UUID]:
+    return PopulatingRepository(entity_key, get_repo(entity_key), resolve_repo=get_repo)
 
 
 def get_repo_view(entity_key: str) -> ViewRepository[Any, UUID]:
-    base = get_repo(entity_key)
-    return PopulatingRepository(entity_key, base, resolve_repo=lambda key: get_repo(key))
+    return _view_repo_for(entity_key)
 
 
 async def _ensure_ready(repo: Repository[Any, UUID]) -> Repository[Any, UUID]:
+    if getattr(repo, "_inited", False):
+        return repo
     if isinstance(repo, (MongoRepository, SqlAlchemyRepository)):
         await repo.init_indexes()
     return repo
@@ -137,15 +158,21 @@ async def _ensure_ready(repo: Repository[Any, UUID]) -> Repository[Any, UUID]:
 
 def provide_repo(entity_key: str) -> Callable[[], Repository[Any, UUID]]:
     async def _dep() -> Repository[Any, UUID]:
-        repo = get_repo(entity_key)
-        return await _ensure_ready(repo)
+        return await _ensure_ready(get_repo(entity_key))
 
     return _dep
 
 
+_provider_views: dict[str, ViewRepository[Any, UUID]] = {}
+
+
 def provide_view_repo(entity_key: str) -> Callable[[], ViewRepository[Any, UUID]]:
     async def _dep() -> ViewRepository[Any, UUID]:
         base = await provide_repo(entity_key)()
-        return PopulatingRepository(entity_key, base, resolve_repo=lambda key: get_repo(key))
+        view = _provider_views.get(entity_key)
+        if view is None or getattr(view, "_inner", None) is not base:
+            view = PopulatingRepository(entity_key, base, resolve_repo=get_repo)
+            _provider_views[entity_key] = view
+        return view
 
     return _dep
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
-from dataclasses import asdict, is_dataclass
+import asyncio
+from dataclasses import is_dataclass
 from typing import Any, Callable, Generic, Hashable, Iterable, Mapping, Optional, Sequence, TypeVar
 
 from persistence_kit.contracts.repository import Repository
 from persistence_kit.contracts.view_repository import ViewRepository
+from persistence_kit.repository.dataclass_fields import field_info
+from persistence_kit.repository.sqlalchemy_repo.sqlalchemy_repo import in_active_unit_of_work
 from persistence_kit.repository.filter_ops import (
     is_logical_key,
     iter_criteria_groups,
@@ -17,8 +20,8 @@ TId = TypeVar("TId", bound=Hashable)
 
 
 def _to_dict(x: Any) -> dict:
-    if is_dataclass(x):
-        return asdict(x)
+    if is_dataclass(x) and not isinstance(x, type):
+        return {name: getattr(x, name) for name in field_info(type(x))[0]}
     if isinstance(x, dict):
         return dict(x)
     return {}
@@ -94,6 +97,14 @@ class PopulatingRepository(ViewRepository[T, TId], Repository[T, TId], Generic[T
         self._key = entity_key
         self._inner = inner
         self._resolve = resolve_repo
+        self._rels: Mapping[str, Any] | None = None
+
+    def _relations(self) -> Mapping[str, Any]:
+        rels = self._rels
+        if rels is None:
+            rels = get_entity_config(self._key).get("relations") or {}
+            self._rels = rels
+        return rels
 
     async def add(self, entity: T) -> None:
         await self._inner.add(entity)
@@ -136,6 +147,7 @@ class PopulatingRepository(ViewRepository[T, TId], Repository[T, TId], Generic[T
             support_includes = _collect_support_includes(criteria)
             items = await self._list_all_entities()
             lookup_cache: dict[tuple[str, str, Hashable], Any] = {}
+            await self._prefetch_relations(items, support_includes, lookup_cache)
             count = 0
             for item in items:
                 row = await self._populate(item, support_includes, lookup_cache)
@@ -226,6 +238,7 @@ class PopulatingRepository(ViewRepository[T, TId], Repository[T, TId], Generic[T
                 ordered = ordered[offset:]
             if limit is not None:
                 ordered = ordered[:limit]
+            await self._prefetch_relations(ordered, include, lookup_cache)
             return [await self._populate(it, include, lookup_cache) for it in ordered]
 
         items = await self._inner.list(
@@ -234,6 +247,7 @@ class PopulatingRepository(ViewRepository[T, TId], Repository[T, TId], Generic[T
             sort_by=sort_by,
             sort_desc=sort_desc,
         )
+        await self._prefetch_relations(items, include, lookup_cache)
         return [await self._populate(it, include, lookup_cache) for it in items]
 
     async def list_by_fields(
@@ -254,6 +268,7 @@ class PopulatingRepository(ViewRepository[T, TId], Repository[T, TId], Generic[T
                 relation_path, _, _ = sort_by.rpartition(".")
                 support_includes = _merge_includes(support_includes, [relation_path])
             items = await self._list_all_entities()
+            await self._prefetch_relations(items, support_includes, lookup_cache)
             hydrated: list[tuple[T, dict]] = []
             for item in items:
                 support_row = await self._populate(item, support_includes, lookup_cache)
@@ -289,6 +304,7 @@ class PopulatingRepository(ViewRepository[T, TId], Repository[T, TId], Generic[T
                 ordered = ordered[offset:]
             if limit is not None:
                 ordered = ordered[:limit]
+            await self._prefetch_relations(ordered, include, lookup_cache)
             return [await self._populate(it, include, lookup_cache) for it in ordered]
 
         items = await self._inner.list_by_fields(
@@ -298,8 +314,85 @@ class PopulatingRepository(ViewRepository[T, TId], Repository[T, TId], Generic[T
             sort_by=sort_by,
             sort_desc=sort_desc,
         )
+        await self._prefetch_relations(items, include, lookup_cache)
         return [await self._populate(it, include, lookup_cache) for it in items]
 
+    async def _prefetch_relations(
+        self,
+        items: Sequence[T],
+        include: Iterable[str],
+        lookup_cache: dict[tuple[str, str, Hashable], Any],
+    ) -> None:
+        if not items:
+            return
+        rels = self._relations()
+        roots = {inc.split(".", 1)[0] for inc in include}
+        pending_ids: list[tuple[str, list[Hashable], Any]] = []
+        pending_each: list[tuple[tuple[str, str, Hashable], bool, Any]] = []
+        for field in roots:
+            rel = rels.get(field)
+            if not rel or rel.get("through"):
+                continue
+            target = rel["target"]
+            by = rel.get("by", "id")
+            local_field = rel["local_field"]
+            many = bool(rel.get("many", False))
+            reverse_field = rel.get("target_field")
+            wanted: set[Hashable] = set()
+            for item in items:
+                value = _field_from_entity(item, local_field)
+                if value is None:
+                    continue
+                if many and not reverse_field and isinstance(value, (list, tuple, set)):
+                    wanted.update(v for v in value if isinstance(v, Hashable))
+                elif isinstance(value, Hashable):
+                    wanted.add(value)
+            if reverse_field:
+                if not many:
+                    continue
+                missing = [v for v in wanted if (target, f"{reverse_field}=", v) not in lookup_cache]
+                if not missing:
+                    continue
+                repo = self._resolve(target)
+                for value in missing:
+                    pending_each.append(
+                        (
+                            (target, f"{reverse_field}=", value),
+                            True,
+                            repo.list_by_fields({reverse_field: value}, limit=None),
+                        )
+                    )
+                continue
+            if by != "id":
+                missing = [v for v in wanted if (target, by, v) not in lookup_cache]
+                if not missing:
+                    continue
+                repo = self._resolve(target)
+                for value in missing:
+                    pending_each.append(((target, by, value), False, repo.get_by_index(by, value)))
+                continue
+            missing = [v for v in wanted if (target, "id", v) not in lookup_cache]
+            if not missing:
+                continue
+            repo = self._resolve(target)
+            pending_ids.append((target, missing, repo.list_by_ids(missing)))
+        if not pending_ids and not pending_each:
+            return
+        fetches = [fetch for _, _, fetch in pending_ids] + [fetch for _, _, fetch in pending_each]
+        if in_active_unit_of_work():
+            results = [await fetch for fetch in fetches]
+        else:
+            results = await asyncio.gather(*fetches)
+        id_results = results[: len(pending_ids)]
+        each_results = results[len(pending_ids):]
+        for (target, missing, _), refs in zip(pending_ids, id_results):
+            for ref in refs:
+                lookup_cache[(target, "id", _field_from_entity(ref, "id"))] = ref
+            for value in missing:
+                lookup_cache.setdefault((target, "id", value), None)
+        for (cache_key, as_list, _), result in zip(pending_each, each_results):
+            lookup_cache[cache_key] = list(result) if as_list else result
+
     async def _resolve_relation(
         self,
         target: str,
@@ -368,8 +461,7 @@ class PopulatingRepository(ViewRepository[T, TId], Repository[T, TId], Generic[T
         lookup_cache: Optional[dict[tuple[str, str, Hashable], Any]] = None,
     ) -> dict:
         cache = lookup_cache if lookup_cache is not None else {}
-        cfg = get_entity_config(self._key)
-        rels = cfg.get("relations") or {}
+        rels = self._relations()
         base = _to_dict(item)
 
         roots: set[str] = set()
@@ -382,115 +474,142 @@ class PopulatingRepository(ViewRepository[T, TId], Repository[T, TId], Generic[T
             else:
                 roots.add(inc)
 
-        for field in roots:
-            relation = rels.get(field)
-            if not relation:
-                continue
-
-            target = relation["target"]
-            by = relation.get("by", "id")
-            many = bool(relation.get("many", False))
-            child_includes = nested.get(field, [])
-
-            if relation.get("through"):
-                source_field = relation.get("source_field", "id")
-                target_field = relation.get("target_field", "id")
-                source_by = relation.get("source_by", "id")
-                target_by = relation.get("target_by", "id")
-                source_value = getattr(item, "id", None) if source_by == "id" else base.get(source_by)
-                if source_value is None:
-                    base[field] = [] if many else None
-                    continue
-                link_repo = self._resolve(relation["through"])
-                links = await link_repo.find_all_by_index(source_field, [source_value])  # type: ignore[attr-defined]
-                target_values = [
-                    candidate
-                    for candidate in (_to_dict(link).get(target_field) for link in links)
-                    if isinstance(candidate, Hashable)
-                ]
-                target_repo = self._resolve(target)
-                if many:
-                    acc: list[dict] = []
-                    for candidate in target_values:
-                        ref = await (
-                            target_repo.get(candidate)
-                            if target_by == "id"
-                            else target_repo.get_by_index(target_by, candidate)
-                        )
-                        if ref is None:
-                            continue
-                        if child_includes:
-                            nested_repo = PopulatingRepository(target, target_repo, self._resolve)
-                            acc.append(await nested_repo._populate(ref, child_includes, cache))
-                        else:
-                            acc.append(_to_dict(ref))
-                    base[field] = acc
-                else:
-                    candidate = target_values[0] if target_values else None
-                    if candidate is None:
-                        base[field] = None
-                    else:
-                        ref = await (
-                            target_repo.get(candidate)
-                            if target_by == "id"
-                            else target_repo.get_by_index(target_by, candidate)
-                        )
-                        if ref is None:
-                            base[field] = None
-                        elif child_includes:
-                            nested_repo = PopulatingRepository(target, target_repo, self._resolve)
-                            base[field] = await nested_repo._populate(ref, child_includes, cache)
-                        else:
-                            base[field] = _to_dict(ref)
-                continue
+        relation_fields = [field for field in roots if rels.get(field)]
+        if not relation_fields:
+            return base
 
-            local_field = relation["local_field"]
-            reverse_target_field = relation.get("target_field")
-            value = getattr(item, local_field, None) if hasattr(item, local_field) else base.get(local_field)
-            if value is None:
-                base[field] = [] if many else None
-                continue
+        if len(relation_fields) == 1 or in_active_unit_of_work():
+            for field in relation_fields:
+                base[field] = await self._relation_value(item, base, rels[field], nested.get(field, []), cache)
+            return base
 
-            if many and reverse_target_field:
-                target_repo = self._resolve(target)
-                refs = await target_repo.list_by_fields({reverse_target_field: value}, limit=None)
-                acc: list[dict] = []
-                for ref in refs:
-                    if child_includes:
-                        nested_repo = PopulatingRepository(target, target_repo, self._resolve)
-                        acc.append(await nested_repo._populate(ref, child_includes, cache))
-                    else:
-                        acc.append(_to_dict(ref))
-                base[field] = acc
-                continue
+        values = await asyncio.gather(
+            *(
+                self._relation_value(item, base, rels[field], nested.get(field, []), cache)
+                for field in relation_fields
+            )
+        )
+        for field, value in zip(relation_fields, values):
+            base[field] = value
+        return base
 
+    async def _relation_value(
+        self,
+        item: T,
+        base: dict,
+        relation: Mapping[str, Any],
+        child_includes: list[str],
+        cache: dict[tuple[str, str, Hashable], Any],
+    ) -> Any:
+        target = relation["target"]
+        by = relation.get("by", "id")
+        many = bool(relation.get("many", False))
+
+        if relation.get("through"):
+            source_field = relation.get("source_field", "id")
+            target_field = relation.get("target_field", "id")
+            source_by = relation.get("source_by", "id")
+            target_by = relation.get("target_by", "id")
+            source_value = getattr(item, "id", None) if source_by == "id" else base.get(source_by)
+            if source_value is None:
+                return [] if many else None
+            link_repo = self._resolve(relation["through"])
+            links = await link_repo.find_all_by_index(source_field, [source_value])  # type: ignore[attr-defined]
+            target_values = [
+                candidate
+                for candidate in (_to_dict(link).get(target_field) for link in links)
+                if isinstance(candidate, Hashable)
+            ]
+            target_repo = self._resolve(target)
             if many:
-                seq = list(value) if isinstance(value, (list, tuple, set)) else [value]
                 acc: list[dict] = []
-                for candidate in seq:
-                    if not isinstance(candidate, Hashable):
-                        continue
-                    ref = await self._resolve_relation(target, by, candidate, cache)
+                for candidate in target_values:
+                    ref = await (
+                        target_repo.get(candidate)
+                        if target_by == "id"
+                        else target_repo.get_by_index(target_by, candidate)
+                    )
                     if ref is None:
                         continue
                     if child_includes:
-                        nested_repo = PopulatingRepository(target, self._resolve(target), self._resolve)
+                        nested_repo = PopulatingRepository(target, target_repo, self._resolve)
                         acc.append(await nested_repo._populate(ref, child_includes, cache))
                     else:
                         acc.append(_to_dict(ref))
-                base[field] = acc
-                continue
-
-            if not isinstance(value, Hashable):
-                base[field] = None
-                continue
-            ref = await self._resolve_relation(target, by, value, cache)
+                return acc
+            candidate = target_values[0] if target_values else None
+            if candidate is None:
+                return None
+            ref = await (
+                target_repo.get(candidate)
+                if target_by == "id"
+                else target_repo.get_by_index(target_by, candidate)
+            )
             if ref is None:
-                base[field] = None
-            elif child_includes:
-                nested_repo = PopulatingRepository(target, self._resolve(target), self._resolve)
-                base[field] = await nested_repo._populate(ref, child_includes, cache)
+                return None
+            if child_includes:
+                nested_repo = PopulatingRepository(target, target_repo, self._resolve)
+                return await nested_repo._populate(ref, child_includes, cache)
+            return _to_dict(ref)
+
+        local_field = relation["local_field"]
+        reverse_target_field = relation.get("target_field")
+        value = getattr(item, local_field, None) if hasattr(item, local_field) else base.get(local_field)
+        if value is None:
+            return [] if many else None
+
+        if many and reverse_target_field:
+            group_key = (
+                (target, f"{reverse_target_field}=", value) if isinstance(value, Hashable) else None
+            )
+            if group_key is not None and group_key in cache:
+                refs = cache[group_key]
             else:
-                base[field] = _to_dict(ref)
+                refs = await self._resolve(target).list_by_fields({reverse_target_field: value}, limit=None)
+                if group_key is not None:
+                    cache[group_key] = list(refs)
+            acc: list[dict] = []
+            for ref in refs:
+                if child_includes:
+                    nested_repo = PopulatingRepository(target, self._resolve(target), self._resolve)
+                    acc.append(await nested_repo._populate(ref, child_includes, cache))
+                else:
+                    acc.append(_to_dict(ref))
+            return acc
 
-        return base
+        if many:
+            seq = list(value) if isinstance(value, (list, tuple, set)) else [value]
+            if by == "id":
+                missing = [
+                    candidate
+                    for candidate in seq
+                    if isinstance(candidate, Hashable) and (target, "id", candidate) not in cache
+                ]
+                get_many = getattr(self._resolve(target), "get_many", None) if missing else None
+                if get_many is not None:
+                    found = await get_many(missing)
+                    for candidate in missing:
+                        cache[(target, "id", candidate)] = found.get(candidate)
+            acc: list[dict] = []
+            for candidate in seq:
+                if not isinstance(candidate, Hashable):
+                    continue
+                ref = await self._resolve_relation(target, by, candidate, cache)
+                if ref is None:
+                    continue
+                if child_includes:
+                    nested_repo = PopulatingRepository(target, self._resolve(target), self._resolve)
+                    acc.append(await nested_repo._populate(ref, child_includes, cache))
+                else:
+                    acc.append(_to_dict(ref))
+            return acc
+
+        if not isinstance(value, Hashable):
+            return None
+        ref = await self._resolve_relation(target, by, value, cache)
+        if ref is None:
+            return None
+        if child_includes:
+            nested_repo = PopulatingRepository(target, self._resolve(target), self._resolve)
+            return await nested_repo._populate(ref, child_includes, cache)
+        return _to_dict(ref)
@@ -173,6 +173,10 @@ async def test_list_by_fields_dict_entities_and_pagination():
     res_unlimited = await repo.list_by_fields({"kind": "k1"}, offset=0, limit=None)
     assert res_unlimited == [d1, d2]
 
+    found = await repo.get_many([3, 1, 3, 99])
+    assert set(found) == {1, 3}
+    assert found[3]["code"] == "z"
+
 
 @pytest.mark.asyncio
 async def test_list_by_fields_range_ops_and_unsupported_op():
@@ -283,3 +287,69 @@ async def test_count_and_distinct_values():
     assert await repo.count_by_fields({"name": "a"}) == 2
     assert await repo.distinct_values("group") == ["g1", "g3"]
     assert await repo.distinct_values("group", {"name": "a"}) == ["g1", "g3"]
+
+
+@pytest.mark.asyncio
+async def test_secondary_indexes_narrow_and_stay_in_sync():
+    repo = MemoryRepository[Entity, int](
+        id_getter=lambda e: e.id,
+        secondary_indexes={"group": lambda e: e.group},
+    )
+
+    e1 = Entity(id=1, name="a", group="g1")
+    e2 = Entity(id=2, name="b", group="g2")
+    e3 = Entity(id=3, name="c", group="g1")
+
+    await repo.add(e1)
+    await repo.add(e2)
+    await repo.add(e3)
+
+    assert await repo.list_by_fields({"group": "g1"}) == [e1, e3]
+    assert await repo.list_by_fields({"group": ["g1", "g2"]}) == [e1, e2, e3]
+
+    await repo.update(Entity(id=3, name="c", group="g2"))
+    assert await repo.list_by_fields({"group": "g1"}) == [e1]
+
+    await repo.delete(1)
+    assert await repo.list_by_fields({"group": "g1"}) == []
+
+
+@pytest.mark.asyncio
+async def test_list_by_ids_returns_known_entities_in_order():
+    repo = MemoryRepository[Entity, int](id_getter=lambda e: e.id)
+    e1 = Entity(id=1, name="a", group="g1")
+    e2 = Entity(id=2, name="b", group="g2")
+    await repo.add(e1)
+    await repo.add(e2)
+
+    assert await repo.list_by_ids([2, 1, 99]) == [e2, e1]
+    assert await repo.list_by_ids([]) == []
+
+
+@pytest.mark.asyncio
+async def test_add_many_adds_all_entities():
+    repo = MemoryRepository[Entity, int](id_getter=lambda e: e.id)
+    e1 = Entity(id=1, name="a", group="g1")
+    e2 = Entity(id=2, name="b", group="g2")
+
+    await repo.add_many([e1, e2])
+    assert await repo.count() == 2
+    assert await repo.get(1) == e1
+
+
+@pytest.mark.asyncio
+async def test_get_many_and_get_many_by_index():
+    repo = MemoryRepository[Entity, int](
+        id_getter=lambda e: e.id,
+        unique_indexes={"by_name": lambda e: e.name},
+    )
+    await repo.add(Entity(id=1, name="a", group="x"))
+    await repo.add(Entity(id=2, name="b", group="y"))
+
+    found = await repo.get_many([2, 1, 2, 99])
+    assert set(found) == {1, 2}
+    assert found[2].name == "b"
+
+    by_name = await repo.get_many_by_index("by_name", ["a", "missing"])
+    assert set(by_name) == {"a"}
+    assert by_name["a"].id == 1
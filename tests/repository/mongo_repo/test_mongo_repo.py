@@ -66,6 +66,15 @@ class FakeCursor:
 
         return list(docs)
 
+    async def __aiter__(self):
+        docs = self.docs
+        if self._skip:
+            docs = docs[self._skip :]
+        if self._limit is not None and self._limit > 0:
+            docs = docs[: self._limit]
+        for doc in docs:
+            yield doc
+
 
 class FakeCollectionForFind:
     def __init__(self, docs: Sequence[Mapping[str, Any]]):
@@ -50,6 +50,19 @@ def test_to_row_converts_enum_and_date():
     assert row["created"] == "2024-01-02"
 
 
+def test_to_row_with_id_and_without_id_respect_custom_id_column():
+    table = Table("entities", MetaData(), Column("pk", Integer, primary_key=True), Column("name", String))
+    mapper = SqlDataclassMapper(Entity, table, id_column="pk")
+    entity = Entity(id=7, name="n", status=Status.ACTIVE, created=datetime.date(2024, 1, 2))
+
+    with_id = mapper.to_row_with_id(entity)
+    assert with_id["pk"] == 7
+
+    without_id = mapper.to_row_without_id(entity)
+    assert "pk" not in without_id
+    assert without_id["name"] == "n"
+
+
 def test_from_row_uses_default_id_column_and_filters_extra_fields():
     mapper = SqlDataclassMapper(Entity, Table("entities", MetaData()))
     entity = mapper.from_row(
@@ -66,3 +79,18 @@ def test_from_row_with_custom_id_column():
     )
     assert entity.id == 7
     assert entity.status == Status.INACTIVE
+
+
+def test_from_row_tuple_maps_positionally_and_custom_id_column():
+    mapper = SqlDataclassMapper(Entity, Table("entities", MetaData()), id_column="pk")
+    cols = ("pk", "name", "status", "created", "extra")
+    entity = mapper.from_row_tuple(cols, (9, "z", Status.ACTIVE, datetime.date(2024, 5, 6), "ignored"))
+    assert entity.id == 9
+    assert entity.name == "z"
+    assert entity.status == Status.ACTIVE
+    assert mapper.from_row_tuple(cols, (10, "w", Status.INACTIVE, datetime.date(2024, 5, 7), None)).id == 10
+
+
+def test_projection_lists_storage_columns_including_custom_id():
+    mapper = SqlDataclassMapper(Entity, Table("entities", MetaData()), id_column="pk")
+    assert mapper.projection() == ("pk", "name", "status", "created")
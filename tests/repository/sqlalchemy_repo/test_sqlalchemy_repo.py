@@ -5,7 +5,7 @@ import pytest
 from sqlalchemy import Column, Integer, MetaData, String, Table
 from sqlalchemy.sql import Delete, Insert, Select, Update
 
-from persistence_kit.repository.sqlalchemy_repo.sqlalchemy_repo import SqlAlchemyRepository, _select_by_fields
+from persistence_kit.repository.sqlalchemy_repo.sqlalchemy_repo import SqlAlchemyRepository, _select_by_fields, unit_of_work
 
 
 @dataclass
@@ -96,13 +96,38 @@ class FakeResult:
         return next(iter(self._rows[0].values()))
 
 
+class _AsyncRows:
+    def __init__(self, rows):
+        self._rows = iter(rows)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._rows)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+class FakeStreamResult:
+    def __init__(self, rows):
+        self._rows = list(rows)
+
+    def __aiter__(self):
+        return _AsyncRows(self._rows)
+
+    def mappings(self):
+        return _AsyncRows(self._rows)
+
+
 class FakeConn:
     def __init__(self, rows_sequence=None, scalar_sequence=None):
         self.rows_sequence = list(rows_sequence or [])
         self.scalar_sequence = list(scalar_sequence or [])
         self.statements: list[Any] = []
 
-    async def execute(self, stmt):
+    async def execute(self, stmt, params=None, execution_options=None):
         self.statements.append(stmt)
         rows = self.rows_sequence.pop(0) if isinstance(stmt, Select) and self.rows_sequence else []
         scalar = self.scalar_sequence.pop(0) if self.scalar_sequence else None
@@ -111,6 +136,11 @@ class FakeConn:
     async def run_sync(self, fn, *args, **kwargs):
         fn(self, *args, **kwargs)
 
+    async def stream(self, stmt, params=None, execution_options=None):
+        self.statements.append(stmt)
+        rows = self.rows_sequence.pop(0) if self.rows_sequence else []
+        return FakeStreamResult(rows)
+
 
 class FakeBeginCtx:
     def __init__(self, conn: FakeConn):
@@ -130,6 +160,9 @@ class FakeEngine:
     def begin(self):
         return FakeBeginCtx(self.conn)
 
+    def connect(self):
+        return FakeBeginCtx(self.conn)
+
 
 def build_table():
     return Table(
@@ -285,3 +318,184 @@ async def test_ensure_indexes_only_once_and_update_no_fields(monkeypatch):
     repo._inited = True
     await repo.update(Item(id=1, name="a", category=None))
     assert repo._engine.conn.statements == []
+
+
+@pytest.mark.asyncio
+async def test_unit_of_work_shares_one_transaction():
+    engine = FakeEngine(rows_sequence=[[{"id": 1, "name": "a", "category": None}]])
+    begin_calls: list[int] = []
+    original_begin = engine.begin
+
+    def counting_begin():
+        begin_calls.append(1)
+        return original_begin()
+
+    engine.begin = counting_begin
+    repo = SqlAlchemyRepository[Item, int](engine, ItemMapper(build_table()), "item")
+    repo._inited = True
+
+    async with unit_of_work(engine):
+        assert (await repo.get(1)).id == 1
+        await repo.count()
+    assert len(begin_calls) == 1
+
+    await repo.count()
+    assert len(begin_calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_unit_of_work_does_not_leak_across_engines():
+    engine_a = FakeEngine()
+    engine_b = FakeEngine()
+    repo_b = SqlAlchemyRepository[Item, int](engine_b, ItemMapper(build_table()), "item")
+    repo_b._inited = True
+
+    async with unit_of_work(engine_a):
+        await repo_b.add(Item(id=1, name="a", category=None))
+
+    assert engine_a.conn.statements == []
+    assert len(engine_b.conn.statements) == 1
+
+
+@pytest.mark.asyncio
+async def test_add_many_and_update_many_use_single_statements():
+    engine = FakeEngine()
+    repo = SqlAlchemyRepository[Item, int](engine, ItemMapper(build_table()), "item")
+    repo._inited = True
+
+    await repo.add_many([Item(id=1, name="a", category=None), Item(id=2, name="b", category="c")])
+    assert len(engine.conn.statements) == 1
+    assert isinstance(engine.conn.statements[0], Insert)
+
+    await repo.update_many([Item(id=1, name="a2", category=None), Item(id=2, name="b2", category="c")])
+    assert len(engine.conn.statements) == 2
+    assert isinstance(engine.conn.statements[1], Update)
+
+    await repo.update_many([])
+    assert len(engine.conn.statements) == 2
+
+
+@pytest.mark.asyncio
+async def test_row_cache_hits_and_invalidates():
+    engine = FakeEngine(
+        rows_sequence=[
+            [{"id": 1, "name": "a", "category": None}],
+            [{"id": 1, "name": "a2", "category": None}],
+        ]
+    )
+    repo = SqlAlchemyRepository[Item, int](engine, ItemMapper(build_table()), "item", row_cache_size=8)
+    repo._inited = True
+
+    first = await repo.get(1)
+    assert (await repo.get(1)) is first
+    assert len(engine.conn.statements) == 1
+
+    await repo.update(Item(id=1, name="a2", category=None))
+    assert (await repo.get(1)).name == "a2"
+    assert len(engine.conn.statements) == 3
+
+
+class RenamedColumnMapper(ItemMapper):
+    def to_row(self, entity: Item) -> Mapping[str, Any]:
+        return {"id": entity.id, "nm": entity.name, "category": entity.category}
+
+    def from_row(self, row: Mapping[str, Any]) -> Item:
+        return Item(id=row["id"], name=row["nm"], category=row["category"])
+
+    def unique_columns(self) -> dict[str, str]:
+        return {"by_name": "nm"}
+
+    def attr_to_storage(self, name: str) -> str:
+        return "nm" if name == "name" else name
+
+    def attr_to_storage_map(self) -> Mapping[str, str]:
+        return {"id": "id", "name": "nm", "category": "category"}
+
+
+@pytest.mark.asyncio
+async def test_get_many_by_index_keys_by_attribute_value():
+    table = Table(
+        "items_renamed",
+        MetaData(),
+        Column("id", Integer, primary_key=True),
+        Column("nm", String),
+        Column("category", String, nullable=True),
+    )
+    engine = FakeEngine(
+        rows_sequence=[[{"id": 1, "nm": "a", "category": None}, {"id": 2, "nm": "b", "category": None}]]
+    )
+    repo = SqlAlchemyRepository[Item, int](engine, RenamedColumnMapper(table), "item")
+    repo._inited = True
+
+    found = await repo.get_many_by_index("by_name", ["a", "b", "zz"])
+    assert set(found) == {"a", "b"}
+    assert found["a"].id == 1
+    assert found["b"].id == 2
+
+
+@pytest.mark.asyncio
+async def test_iter_by_fields_streams_matching_rows():
+    engine = FakeEngine(
+        rows_sequence=[[{"id": 1, "name": "a", "category": "c1"}, {"id": 2, "name": "b", "category": "c1"}]]
+    )
+    repo = SqlAlchemyRepository[Item, int](engine, ItemMapper(build_table()), "item")
+    repo._inited = True
+
+    items = [item async for item in repo.iter_by_fields({"category": "c1"}, limit=None)]
+    assert [item.id for item in items] == [1, 2]
+    stmt = engine.conn.statements[0]
+    assert stmt.get_execution_options().get("stream_results") is True
+
+    assert [item async for item in repo.iter_by_fields({"id": []})] == []
+    assert len(engine.conn.statements) == 1
+
+
+def test_skip_unchanged_updates_requires_row_cache():
+    with pytest.raises(ValueError):
+        SqlAlchemyRepository[Item, int](
+            FakeEngine(), ItemMapper(build_table()), "item", skip_unchanged_updates=True
+        )
+
+
+@pytest.mark.asyncio
+async def test_skip_unchanged_updates_short_circuits():
+    engine = FakeEngine(rows_sequence=[[{"id": 1, "name": "a", "category": None}]])
+    repo = SqlAlchemyRepository[Item, int](
+        engine, ItemMapper(build_table()), "item", row_cache_size=8, skip_unchanged_updates=True
+    )
+    repo._inited = True
+
+    await repo.get(1)
+    assert len(engine.conn.statements) == 1
+
+    await repo.update(Item(id=1, name="a", category=None))
+    assert len(engine.conn.statements) == 1
+
+    await repo.update(Item(id=1, name="a2", category=None))
+    assert len(engine.conn.statements) == 2
+
+
+@pytest.mark.asyncio
+async def test_schema_init_memoized_per_engine_url(monkeypatch):
+    import persistence_kit.repository.sqlalchemy_repo.sqlalchemy_repo as mod
+
+    class UrlEngine(FakeEngine):
+        url = "sqlite+aiosqlite:///memo-test"
+
+    calls = []
+
+    async def fake_init_indexes(self):
+        calls.append(1)
+        self._inited = True
+
+    monkeypatch.setattr(SqlAlchemyRepository, "init_indexes", fake_init_indexes)
+    monkeypatch.setattr(mod, "_SCHEMA_READY", set())
+    monkeypatch.setattr(mod, "_SCHEMA_LOCKS", {})
+
+    repo1 = SqlAlchemyRepository[Item, int](UrlEngine(), ItemMapper(build_table()), "item")
+    await repo1._ensure_indexes()
+    repo2 = SqlAlchemyRepository[Item, int](UrlEngine(), ItemMapper(build_table()), "item")
+    await repo2._ensure_indexes()
+
+    assert calls == [1]
+    assert repo2._inited is True
@@ -0,0 +1,25 @@
+from dataclasses import dataclass
+
+from persistence_kit.repository.dataclass_fields import field_info, field_name_set
+
+
+@dataclass
+class Entity:
+    id: str
+    name: str
+    value: int
+
+
+def test_field_info_returns_names_in_declaration_order():
+    names, fs = field_info(Entity)
+    assert names == ("id", "name", "value")
+    assert tuple(f.name for f in fs) == names
+
+
+def test_field_info_is_cached_per_class():
+    assert field_info(Entity) is field_info(Entity)
+    assert field_name_set(Entity) is field_name_set(Entity)
+
+
+def test_field_name_set_membership():
+    assert field_name_set(Entity) == frozenset({"id", "name", "value"})
@@ -59,3 +59,18 @@ def test_match_criteria_supports_logical_groups():
         {"and": [{"course.name": {"icontains": "mate"}}, {"professor.name": {"icontains": "juan"}}]},
         lambda field: payload.get(field),
     )
+
+
+def test_compile_criteria_matches_like_match_criteria():
+    from persistence_kit.repository.filter_ops import compile_criteria
+
+    matcher = compile_criteria({"name": {"icontains": "per"}, "age": {"gte": 18}})
+    assert matcher(lambda field: {"name": "Juan Perez", "age": 30}.get(field))
+    assert not matcher(lambda field: {"name": "Juan Perez", "age": 10}.get(field))
+
+
+def test_compile_criteria_validates_range_dict_once():
+    from persistence_kit.repository.filter_ops import compile_criteria
+
+    with pytest.raises(ValueError):
+        compile_criteria({"age": {"bad": 1}})
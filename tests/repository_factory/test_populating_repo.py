@@ -103,6 +103,10 @@ class FakeChildRepo:
             rows = rows[:limit]
         return rows
 
+    async def list_by_ids(self, ids: Sequence[Hashable]) -> Sequence[Any]:
+        self.called.setdefault("list_by_ids", []).append(list(ids))
+        return [self.by_id[i] for i in ids if i in self.by_id]
+
 
 @dataclass
 class Info:
@@ -230,6 +234,146 @@ async def test_list_by_fields_nested_sort_and_reverse_relation(monkeypatch):
     assert {row["id"] for row in result["children"]} == {1, 2}
 
 
+@pytest.mark.asyncio
+async def test_list_with_batches_by_id_relation_into_one_query(monkeypatch):
+    import persistence_kit.repository_factory.view.populating_repository as pr
+
+    parents = [
+        Parent(id=10, child_id=1, child_ids=[]),
+        Parent(id=20, child_id=2, child_ids=[]),
+        Parent(id=30, child_id=2, child_ids=[]),
+    ]
+    child_repo = FakeChildRepo(
+        by_id={1: Child(id=1, code="c1", name="uno"), 2: Child(id=2, code="c2", name="dos")},
+        by_code={},
+    )
+    inner = FakeInnerRepo(parents[0], entities=parents)
+    monkeypatch.setattr(
+        pr,
+        "get_entity_config",
+        lambda _: {"relations": {"child": {"local_field": "child_id", "target": "child", "by": "id", "many": False}}},
+    )
+
+    repo = PopulatingRepository("parent", inner, lambda _: child_repo)
+    result = await repo.list_with(offset=0, limit=10, include=["child"])
+
+    assert [row["child"]["name"] for row in result] == ["uno", "dos", "dos"]
+    assert len(child_repo.called["list_by_ids"]) == 1
+    assert sorted(child_repo.called["list_by_ids"][0]) == [1, 2]
+    assert "get" not in child_repo.called
+
+
+@pytest.mark.asyncio
+async def test_prefetch_seeds_missing_ids_without_per_item_fallback(monkeypatch):
+    import persistence_kit.repository_factory.view.populating_repository as pr
+
+    parents = [
+        Parent(id=10, child_id=1, child_ids=[]),
+        Parent(id=20, child_id=99, child_ids=[]),
+    ]
+    child_repo = FakeChildRepo(by_id={1: Child(id=1, code="c1", name="uno")}, by_code={})
+    inner = FakeInnerRepo(parents[0], entities=parents)
+    monkeypatch.setattr(
+        pr,
+        "get_entity_config",
+        lambda _: {"relations": {"child": {"local_field": "child_id", "target": "child", "by": "id", "many": False}}},
+    )
+
+    repo = PopulatingRepository("parent", inner, lambda _: child_repo)
+    result = await repo.list_with(offset=0, limit=10, include=["child"])
+
+    assert result[0]["child"]["name"] == "uno"
+    assert result[1]["child"] is None
+    assert len(child_repo.called["list_by_ids"]) == 1
+    assert "get" not in child_repo.called
+
+
+@pytest.mark.asyncio
+async def test_prefetch_reverse_relation_queries_once_per_parent_value(monkeypatch):
+    import persistence_kit.repository_factory.view.populating_repository as pr
+
+    parents = [
+        Parent(id=10, child_id=None, child_ids=[]),
+        Parent(id=20, child_id=None, child_ids=[]),
+    ]
+    child_repo = FakeChildRepo(
+        by_id={
+            1: Child(id=1, code="c1", name="a", parent_id=10),
+            2: Child(id=2, code="c2", name="b", parent_id=10),
+            3: Child(id=3, code="c3", name="c", parent_id=20),
+        },
+        by_code={},
+    )
+    inner = FakeInnerRepo(parents[0], entities=parents)
+    monkeypatch.setattr(
+        pr,
+        "get_entity_config",
+        lambda _: {
+            "relations": {
+                "children": {
+                    "local_field": "id",
+                    "target": "child",
+                    "target_field": "parent_id",
+                    "many": True,
+                }
+            }
+        },
+    )
+
+    repo = PopulatingRepository("parent", inner, lambda _: child_repo)
+    result = await repo.list_with(offset=0, limit=10, include=["children"])
+
+    assert {row["id"] for row in result[0]["children"]} == {1, 2}
+    assert [row["id"] for row in result[1]["children"]] == [3]
+    assert len(child_repo.called["list_by_fields"]) == 2
+    assert sorted(call["criteria"]["parent_id"] for call in child_repo.called["list_by_fields"]) == [10, 20]
+
+
+@pytest.mark.asyncio
+async def test_prefetch_awaits_sequentially_inside_unit_of_work(monkeypatch):
+    import persistence_kit.repository_factory.view.populating_repository as pr
+
+    parents = [
+        Parent(id=10, child_id=None, child_ids=[]),
+        Parent(id=20, child_id=None, child_ids=[]),
+    ]
+    child_repo = FakeChildRepo(
+        by_id={
+            1: Child(id=1, code="c1", name="a", parent_id=10),
+            2: Child(id=2, code="c2", name="b", parent_id=20),
+        },
+        by_code={},
+    )
+    inner = FakeInnerRepo(parents[0], entities=parents)
+    monkeypatch.setattr(
+        pr,
+        "get_entity_config",
+        lambda _: {
+            "relations": {
+                "children": {
+                    "local_field": "id",
+                    "target": "child",
+                    "target_field": "parent_id",
+                    "many": True,
+                }
+            }
+        },
+    )
+    monkeypatch.setattr(pr, "in_active_unit_of_work", lambda: True)
+
+    async def fail_gather(*args, **kwargs):
+        raise AssertionError("gather must not run inside a unit of work")
+
+    monkeypatch.setattr(pr.asyncio, "gather", fail_gather)
+
+    repo = PopulatingRepository("parent", inner, lambda _: child_repo)
+    result = await repo.list_with(offset=0, limit=10, include=["children"])
+
+    assert [row["id"] for row in result[0]["children"]] == [1]
+    assert [row["id"] for row in result[1]["children"]] == [2]
+    assert len(child_repo.called["list_by_fields"]) == 2
+
+
 @pytest.mark.asyncio
 async def test_count_and_count_by_fields_delegate_to_inner():
     parent = Parent(id=10, child_id=1, child_ids=[])
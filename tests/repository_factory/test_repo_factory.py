@@ -21,9 +21,16 @@ from persistence_kit.repository_factory.factory.repository_factory import (
 
 @pytest.fixture(autouse=True)
 def clear_caches():
+    import persistence_kit.repository_factory.factory.repository_factory as rf
+
     _mongo_db.cache_clear()
     _repo_cached.cache_clear()
     _init_registry.cache_clear()
+    rf._resolved.clear()
+    rf._view_repo_for.cache_clear()
+    rf._provider_views.clear()
+    rf._memory_unique.cache_clear()
+    rf._unique_storage_map.cache_clear()
 
 
 @dataclass